@@ -0,0 +1,181 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Optional, Sequence
+
+from solutions import bench, cache, gate, instrument, parallel, server
+from solutions.registry import DAYS, PARTS, get_solver
+
+
+def run(
+    day: str,
+    parts: Sequence[int],
+    input_path: Optional[Path],
+    result_cache: Optional[cache.ResultCache],
+) -> None:
+    for answer in cache.solve(get_solver(day), parts, input_path, result_cache):
+        print(answer.answer)
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--no-cache", action="store_false", dest="use_cache")
+    parser.add_argument("--cache-dir", type=Path, default=cache.DEFAULT_CACHE_DIR)
+    parser.add_argument("--cache-max-bytes", type=int, default=cache.DEFAULT_MAX_BYTES)
+
+
+def get_result_cache(args: argparse.Namespace) -> Optional[cache.ResultCache]:
+    if not args.use_cache:
+        return None
+
+    return cache.ResultCache(args.cache_dir, args.cache_max_bytes)
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m solutions")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Solve a single day")
+    run_parser.add_argument("day", choices=DAYS)
+    run_parser.add_argument("--part", type=int, choices=PARTS)
+    run_parser.add_argument("--input", type=Path, dest="input_path")
+    add_cache_arguments(run_parser)
+
+    bench_parser = subparsers.add_parser("bench", help="Time each day's phases")
+    bench_parser.add_argument("days", nargs="*", metavar="day", default=DAYS)
+    bench_parser.add_argument(
+        "--scales", type=int, nargs="+", default=bench.DEFAULT_SCALES
+    )
+    bench_parser.add_argument(
+        "--phases", nargs="+", choices=bench.PHASES, default=bench.PHASES
+    )
+    bench_parser.add_argument("--repeat", type=int, default=bench.DEFAULT_REPEAT)
+    bench_parser.add_argument("--output", type=Path, dest="output_path")
+
+    gate_parser = subparsers.add_parser(
+        "gate", help="Fail if any phase got slower than the stored baseline"
+    )
+    gate_parser.add_argument("days", nargs="*", metavar="day", default=DAYS)
+    gate_parser.add_argument(
+        "--baseline",
+        type=Path,
+        dest="baseline_path",
+        default=gate.DEFAULT_BASELINE_PATH,
+    )
+    gate_parser.add_argument("--scales", type=int, nargs="+", default=(1,))
+    gate_parser.add_argument("--repeat", type=int, default=bench.DEFAULT_REPEAT)
+    gate_parser.add_argument("--tolerance", type=float, default=gate.DEFAULT_TOLERANCE)
+    gate_parser.add_argument(
+        "--min-delta", type=float, dest="min_delta_s", default=gate.DEFAULT_MIN_DELTA_S
+    )
+    gate_parser.add_argument(
+        "--update", action="store_true", help="Replace the baseline with this run"
+    )
+
+    profile_parser = subparsers.add_parser(
+        "profile", help="Time and trace each phase of some days"
+    )
+    profile_parser.add_argument("days", nargs="*", metavar="day", default=DAYS)
+    profile_parser.add_argument("--part", type=int, choices=PARTS)
+    profile_parser.add_argument(
+        "--no-memory", action="store_false", dest="trace_memory"
+    )
+    profile_parser.add_argument("--profile-dir", type=Path)
+    profile_parser.add_argument("--output", type=Path, dest="output_path")
+
+    all_parser = subparsers.add_parser("all", help="Solve every day in parallel")
+    all_parser.add_argument("days", nargs="*", metavar="day", default=DAYS)
+    all_parser.add_argument("--workers", type=int)
+    all_parser.add_argument(
+        "--timings",
+        type=Path,
+        dest="timings_path",
+        default=parallel.DEFAULT_TIMINGS_PATH,
+    )
+    add_cache_arguments(all_parser)
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="Answer JSON queries over HTTP from resident parsed inputs"
+    )
+    serve_parser.add_argument("--host", default=server.DEFAULT_HOST)
+    serve_parser.add_argument("--port", type=int, default=server.DEFAULT_PORT)
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = get_parser()
+    args = parser.parse_args(argv)
+
+    if unknown_days := set(getattr(args, "days", ())) - set(DAYS):
+        parser.error(f"unknown days: {', '.join(sorted(unknown_days))}")
+
+    if args.command == "run":
+        run(
+            args.day,
+            (args.part,) if args.part else PARTS,
+            args.input_path,
+            get_result_cache(args),
+        )
+    elif args.command == "bench":
+        results = bench.run_benchmarks(args.days, args.scales, args.repeat, args.phases)
+        print(bench.format_table(results))
+
+        if args.output_path:
+            bench.write_json(results, args.output_path)
+    elif args.command == "gate":
+        # Checked up front, rather than after benchmarking everything
+        if not args.update and not args.baseline_path.exists():
+            print(
+                f"No baseline at {args.baseline_path}, record one with gate --update",
+                file=sys.stderr,
+            )
+            return 1
+
+        results = bench.run_benchmarks(args.days, args.scales, args.repeat)
+        print(bench.format_table(results))
+
+        if args.update:
+            gate.update_baseline(args.baseline_path, results)
+            return 0
+
+        baseline = gate.load_baseline(args.baseline_path)
+        missing = gate.find_missing(results, baseline)
+        regressions = gate.find_regressions(
+            results, baseline, args.tolerance, args.min_delta_s
+        )
+        for day, phase, scale in missing:
+            print(f"No baseline for {day} {phase} at {scale}x", file=sys.stderr)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+
+        return 1 if missing or regressions else 0
+    elif args.command == "profile":
+        instrumenter = instrument.Instrumenter(args.trace_memory, args.profile_dir)
+
+        for day in args.days:
+            instrument.run_instrumented(
+                get_solver(day), (args.part,) if args.part else PARTS, instrumenter
+            )
+
+        print(instrumenter.format_table())
+
+        if args.output_path:
+            instrumenter.write_json(args.output_path)
+    elif args.command == "all":
+        start = time.perf_counter()
+
+        for result in parallel.run_all(
+            args.days, args.workers, args.timings_path, get_result_cache(args)
+        ):
+            print(result)
+
+        print(f"Total: {time.perf_counter() - start:.3f}s")
+    elif args.command == "serve":
+        server.serve(args.host, args.port)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+import itertools
+import json
+import math
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from solutions.day08 import solution as day08
+from solutions.day08.repair import find_repairs
+from solutions.inputs import iter_lines
+from solutions.registry import DAYS, Solver, get_solver
+
+DEFAULT_SCALES: Sequence[int] = (1, 10, 100)
+DEFAULT_REPEAT = 5
+PHASES: Sequence[str] = ("parse", "part1", "part2")
+TOGGLED_OPERATIONS = {"nop": "jmp", "jmp": "nop"}
+
+Scaler = Callable[[Sequence[str], int], Sequence[str]]
+PhaseSetup = Callable[[], Any]
+PhaseFunc = Callable[[Any], Any]
+
+
+@dataclass
+class PhaseResult:
+    day: str
+    phase: str
+    scale: int
+    runs: int
+    median_s: float
+    p95_s: float
+    peak_bytes: int
+    error: Optional[str] = None
+
+
+def repeat_lines(input_lines: Sequence[str], factor: int) -> Sequence[str]:
+    return list(input_lines) * factor
+
+
+def repeat_records(input_lines: Sequence[str], factor: int) -> Sequence[str]:
+    # Records are separated by exactly one blank line, so trailing blanks are
+    # stripped before copies are joined back together
+    lines = list(input_lines)
+    while lines and not lines[-1]:
+        lines.pop()
+
+    return list(itertools.chain(*itertools.repeat([*lines, ""], factor)))[:-1]
+
+
+def repeat_adapters(input_lines: Sequence[str], factor: int) -> Sequence[str]:
+    # Each copy is raised to start 3 jolts above the last one's top adapter,
+    # so the copies still join into one valid chain
+    adapters = list(map(int, input_lines))
+    if not adapters:
+        return []
+
+    step = max(adapters) - min(adapters) + 3
+    return [
+        str(adapter + copy * step) for copy in range(factor) for adapter in adapters
+    ]
+
+
+def repeat_repaired_program(input_lines: Sequence[str], factor: int) -> Sequence[str]:
+    # Running off the end of one copy starts the next, so only the first copy
+    # is left broken and the rest have the repair applied, which leaves the
+    # whole program with a repair that lets it terminate
+    repairs = find_repairs(day08.parse(input_lines))
+    if not repairs:
+        return list(input_lines)
+
+    repaired = list(input_lines)
+    line = repaired[repairs[0].index]
+    repaired[repairs[0].index] = TOGGLED_OPERATIONS[line[:3]] + line[3:]
+    return [*input_lines, *repaired * (factor - 1)]
+
+
+def fixed_size(input_lines: Sequence[str], _: int) -> Sequence[str]:
+    return list(input_lines)
+
+
+# Days 13 and 15 have inputs whose size doesn't drive the work done, and
+# repeating day 13's buses would hand duplicate moduli to the CRT solver.
+# Plain copies of days 08 and 10 wouldn't be valid puzzles any more
+SCALERS: Dict[str, Scaler] = {
+    "day04": repeat_records,
+    "day06": repeat_records,
+    "day08": repeat_repaired_program,
+    "day10": repeat_adapters,
+    "day13": fixed_size,
+    "day15": fixed_size,
+}
+
+
+def percentile(samples: Sequence[float], percent: float) -> float:
+    ordered = sorted(samples)
+    rank = math.ceil(percent / 100 * len(ordered))
+    return ordered[max(rank, 1) - 1]
+
+
+def get_scaled_input(solver: Solver, scale: int) -> Sequence[str]:
+    scaler = SCALERS.get(solver.day, repeat_lines)
+    return scaler(list(iter_lines(solver.input_path)), scale)
+
+
+def time_call(func: PhaseFunc, setup: PhaseSetup) -> float:
+    argument = setup()
+    start = time.perf_counter()
+    func(argument)
+    return time.perf_counter() - start
+
+
+def get_peak_memory(func: PhaseFunc, setup: PhaseSetup) -> int:
+    argument = setup()
+    tracemalloc.start()
+    try:
+        func(argument)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def get_phase_calls(
+    solver: Solver, input_lines: Sequence[str]
+) -> Sequence[Tuple[str, PhaseSetup, PhaseFunc]]:
+    # Parsed inputs may memoize answers, as day 02 and day 07 do, so every
+    # part sample gets a fresh parse that isn't included in its timing
+    def parse() -> Any:
+        return solver.parse(input_lines)
+
+    return (
+        ("parse", lambda: input_lines, solver.parse),
+        ("part1", parse, solver.part1),
+        ("part2", parse, solver.part2),
+    )
+
+
+def bench_phase(
+    day: str,
+    phase: str,
+    scale: int,
+    setup: PhaseSetup,
+    func: PhaseFunc,
+    repeat: int,
+) -> PhaseResult:
+    try:
+        # Timing runs are kept apart from the traced run, which is much slower
+        samples = [time_call(func, setup) for _ in range(repeat)]
+        peak_bytes = get_peak_memory(func, setup)
+    except Exception as error:  # pylint: disable=broad-except
+        return PhaseResult(day, phase, scale, 0, math.nan, math.nan, 0, repr(error))
+
+    return PhaseResult(
+        day,
+        phase,
+        scale,
+        repeat,
+        statistics.median(samples),
+        percentile(samples, 95),
+        peak_bytes,
+    )
+
+
+def bench_day(
+    day: str, scales: Sequence[int], repeat: int, phases: Sequence[str] = PHASES
+) -> Iterable[PhaseResult]:
+    solver = get_solver(day)
+
+    for scale in scales:
+        input_lines = get_scaled_input(solver, scale)
+
+        for phase, setup, func in get_phase_calls(solver, input_lines):
+            if phase in phases:
+                yield bench_phase(day, phase, scale, setup, func, repeat)
+
+
+def run_benchmarks(
+    days: Sequence[str] = DAYS,
+    scales: Sequence[int] = DEFAULT_SCALES,
+    repeat: int = DEFAULT_REPEAT,
+    phases: Sequence[str] = PHASES,
+) -> List[PhaseResult]:
+    return [result for day in days for result in bench_day(day, scales, repeat, phases)]
+
+
+def to_json(results: Sequence[PhaseResult]) -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "timestamp": time.time(),
+        "results": [
+            {
+                key: (None if isinstance(value, float) and math.isnan(value) else value)
+                for key, value in asdict(result).items()
+            }
+            for result in results
+        ],
+    }
+
+
+def write_json(results: Sequence[PhaseResult], output_path: Path) -> None:
+    with open(output_path, "w") as file_handle:
+        json.dump(to_json(results), file_handle, indent=2)
+
+
+def format_table(results: Sequence[PhaseResult]) -> str:
+    rows = [
+        f"{'day':<6} {'scale':>5} {'phase':<6} {'median':>10} {'p95':>10} {'peak':>12}"
+    ]
+
+    for result in results:
+        if result.error:
+            rows.append(
+                f"{result.day:<6} {result.scale:>5} {result.phase:<6} {result.error}"
+            )
+            continue
+
+        rows.append(
+            f"{result.day:<6} {result.scale:>5} {result.phase:<6} "
+            f"{result.median_s * 1000:>8.2f}ms {result.p95_s * 1000:>8.2f}ms "
+            f"{result.peak_bytes / 1024:>10.1f}KB"
+        )
+
+    return "\n".join(rows)
@@ -0,0 +1,32 @@
+import functools
+import itertools
+from typing import Iterator, List
+
+# int.bit_count only exists from 3.10, and avoids building a string of bits
+HAS_BIT_COUNT = hasattr(int, "bit_count")
+DIGIT_TO_FLAG = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def popcount(bits: int) -> int:
+    return bits.bit_count() if HAS_BIT_COUNT else bin(bits).count("1")
+
+
+def iter_set_bits(bits: int) -> Iterator[int]:
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+def get_set_bits(bits: int) -> List[int]:
+    """Every set bit in a few C-level passes, for sets too dense to iterate"""
+    flags = bin(bits)[:1:-1].encode().translate(DIGIT_TO_FLAG)
+    return list(itertools.compress(range(len(flags)), flags))
+
+
+@functools.lru_cache(maxsize=64)
+def get_strided_mask(stride: int, limit: int) -> int:
+    """Bits 0, stride, 2 * stride, ... below limit"""
+    count = (limit + stride - 1) // stride
+    # Dividing 2^(stride * count) - 1 by 2^stride - 1 repeats a 1 every stride
+    return ((1 << (stride * count)) - 1) // ((1 << stride) - 1)
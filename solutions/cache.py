@@ -0,0 +1,170 @@
+import functools
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from solutions.inputs import PathLike, iter_lines, map_input
+from solutions.registry import Solver
+
+SOURCE_ROOT = Path(__file__).resolve().parent
+DEFAULT_CACHE_DIR = Path(".solver_cache")
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+ENTRY_SUFFIX = ".json"
+
+
+@dataclass
+class CachedAnswer:
+    answer: Any
+    cached: bool
+
+
+def hash_file(file_path: PathLike) -> str:
+    with map_input(file_path) as buffer:
+        return hashlib.sha256(buffer).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def hash_source_tree(source_root: Path = SOURCE_ROOT) -> str:
+    """One digest over every module in the package
+
+    Days share helpers such as bits.py and keep most of their code outside the
+    entry module, so any source change has to invalidate every answer. Modules
+    are only imported once per process, so hashing once per process is enough.
+    """
+    digest = hashlib.sha256()
+
+    for source_path in sorted(source_root.rglob("*.py")):
+        digest.update(str(source_path.relative_to(source_root)).encode())
+        digest.update(hash_file(source_path).encode())
+
+    return digest.hexdigest()
+
+
+def remove_entry(entry_path: PathLike) -> None:
+    try:
+        os.remove(entry_path)
+    except FileNotFoundError:
+        pass
+
+
+class ResultCache:
+    """Answers stored one file per key, with file mtimes tracking recency"""
+
+    def __init__(
+        self, cache_dir: Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def get_keys(
+        self, solver: Solver, parts: Sequence[int], input_path: PathLike
+    ) -> Dict[int, str]:
+        input_digest = hash_file(input_path)
+        source_digest = hash_source_tree()
+
+        return {
+            part: hashlib.sha256(
+                f"{solver.day}:{part}:{input_digest}:{source_digest}".encode()
+            ).hexdigest()
+            for part in parts
+        }
+
+    def get_entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> Optional[CachedAnswer]:
+        entry_path = self.get_entry_path(key)
+
+        try:
+            with open(entry_path) as file_handle:
+                entry = json.load(file_handle)
+        except (FileNotFoundError, ValueError):
+            return None
+
+        # Touching the entry on a hit is what makes eviction least recently used.
+        # Another worker may have evicted it since the read, which is fine, as
+        # the answer is already in hand
+        try:
+            os.utime(entry_path)
+        except FileNotFoundError:
+            pass
+
+        return CachedAnswer(entry["answer"], True)
+
+    def put(self, key: str, answer: Any) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Written to a temporary file first so readers never see half an entry
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.cache_dir)
+        with os.fdopen(file_descriptor, "w") as file_handle:
+            json.dump({"answer": answer}, file_handle)
+        os.replace(temp_path, self.get_entry_path(key))
+
+        self.evict()
+
+    def get_entries(self) -> Iterable[os.DirEntry]:
+        if not self.cache_dir.exists():
+            return []
+
+        return (
+            entry
+            for entry in os.scandir(self.cache_dir)
+            if entry.name.endswith(ENTRY_SUFFIX)
+        )
+
+    def evict(self) -> None:
+        entries = []
+
+        # Parallel workers evict from the same directory, so any entry can
+        # disappear between being listed and being looked at or removed
+        for entry in self.get_entries():
+            try:
+                entries.append((entry.stat(), entry.path))
+            except FileNotFoundError:
+                continue
+
+        entries.sort(key=lambda pair: pair[0].st_mtime)
+        total_bytes = sum(stat.st_size for stat, _ in entries)
+
+        for stat, entry_path in entries:
+            if total_bytes <= self.max_bytes:
+                break
+
+            remove_entry(entry_path)
+            total_bytes -= stat.st_size
+
+    def clear(self) -> None:
+        for entry in self.get_entries():
+            remove_entry(entry.path)
+
+
+def solve(
+    solver: Solver,
+    parts: Sequence[int],
+    input_path: Optional[PathLike] = None,
+    result_cache: Optional[ResultCache] = None,
+) -> List[CachedAnswer]:
+    input_path = input_path or solver.input_path
+    keys = result_cache.get_keys(solver, parts, input_path) if result_cache else {}
+    answers: Dict[int, CachedAnswer] = {}
+
+    for part, key in keys.items():
+        if result_cache and (hit := result_cache.get(key)):
+            answers[part] = hit
+
+    # Input is only parsed if at least one part missed the cache
+    if missing_parts := [part for part in parts if part not in answers]:
+        parsed = solver.parse(iter_lines(input_path))
+
+        for part in missing_parts:
+            answer = solver.get_part(part)(parsed)
+            answers[part] = CachedAnswer(answer, False)
+
+            if result_cache:
+                result_cache.put(keys[part], answer)
+
+    return [answers[part] for part in parts]
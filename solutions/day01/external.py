@@ -0,0 +1,157 @@
+import argparse
+import math
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, Optional, Sequence, Tuple
+
+from solutions.inputs import PathLike, iter_chunks
+
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+# A small int held in a set costs its object plus its share of the hash table
+BYTES_PER_VALUE = 100
+MAX_OPEN_BUCKETS = 256
+WRITE_BUFFER_BYTES = 64 * 1024
+# Multiplying by an odd constant close to 2^64 / phi scatters any stride of
+# keys, and the high bits of the product are the best mixed
+BUCKET_MIX = 0x9E3779B97F4A7C15
+HASH_MASK = (1 << 64) - 1
+HASH_SHIFT = 32
+
+
+def iter_numbers(input_path: PathLike) -> Iterator[int]:
+    for chunk in iter_chunks(input_path):
+        yield from map(int, chunk.split())
+
+
+def estimate_count(input_path: PathLike) -> int:
+    size = os.path.getsize(input_path)
+    sample = next(iter_chunks(input_path), b"")
+
+    if not sample:
+        return 0
+
+    return math.ceil(size * (sample.count(b"\n") or 1) / len(sample))
+
+
+def get_bucket_count(input_path: PathLike, memory_budget: int) -> int:
+    return max(
+        1, math.ceil(estimate_count(input_path) * BYTES_PER_VALUE / memory_budget)
+    )
+
+
+def get_open_buckets(memory_budget: int) -> int:
+    # Every open bucket holds a full write buffer, so they come out of the budget
+    return max(1, min(MAX_OPEN_BUCKETS, memory_budget // WRITE_BUFFER_BYTES))
+
+
+def get_bucket(value: int, target: int, buckets: int) -> int:
+    # A value and its complement share min(value, target - value), so any
+    # pair summing to the target always ends up in the same bucket. The key is
+    # mixed first, as values sharing a factor with the bucket count, like
+    # round amounts, would otherwise pile into a few buckets
+    key = min(value, target - value)
+    return (((key * BUCKET_MIX) & HASH_MASK) >> HASH_SHIFT) % buckets
+
+
+def partition(
+    input_path: PathLike,
+    target: int,
+    buckets: int,
+    bucket_dir: Path,
+    open_buckets: int = MAX_OPEN_BUCKETS,
+) -> Sequence[Path]:
+    bucket_paths = [bucket_dir / f"bucket{index:05}" for index in range(buckets)]
+
+    # Each pass rereads the input, so that open files and their buffers stay
+    # under the limit
+    for first in range(0, buckets, open_buckets):
+        last = min(first + open_buckets, buckets)
+        handles: Dict[int, BinaryIO] = {
+            index: open(bucket_paths[index], "wb", buffering=WRITE_BUFFER_BYTES)
+            for index in range(first, last)
+        }
+
+        try:
+            for value in iter_numbers(input_path):
+                if first <= (bucket := get_bucket(value, target, buckets)) < last:
+                    handles[bucket].write(b"%d\n" % value)
+        finally:
+            for handle in handles.values():
+                handle.close()
+
+    return bucket_paths
+
+
+def find_pair_in_bucket(bucket_path: Path, target: int) -> Optional[Tuple[int, int]]:
+    seen = set()
+
+    for value in iter_numbers(bucket_path):
+        if target - value in seen:
+            return target - value, value
+
+        seen.add(value)
+
+    return None
+
+
+def find_pair(
+    input_path: PathLike,
+    target: int,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    workers: Optional[int] = None,
+    work_dir: Optional[PathLike] = None,
+) -> Optional[Tuple[int, int]]:
+    """Find two entries summing to target while holding one bucket per worker
+
+    The budget is split between the workers, so the number of buckets grows
+    with both the input size and the amount of parallelism. Partitioning
+    happens first, and keeps its write buffers within the budget on its own.
+    """
+    workers = workers or os.cpu_count() or 1
+    buckets = get_bucket_count(input_path, memory_budget // workers)
+
+    with tempfile.TemporaryDirectory(dir=work_dir) as bucket_dir:
+        bucket_paths = partition(
+            input_path,
+            target,
+            buckets,
+            Path(bucket_dir),
+            get_open_buckets(memory_budget),
+        )
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(find_pair_in_bucket, bucket_path, target)
+                for bucket_path in bucket_paths
+            ]
+
+            try:
+                for future in as_completed(futures):
+                    if pair := future.result():
+                        return pair
+            finally:
+                # Otherwise leaving the block waits for every remaining bucket.
+                # Done by hand, as shutdown's cancel_futures needs Python 3.9
+                for future in futures:
+                    future.cancel()
+
+    return None
+
+
+if __name__ == "__main__":
+    PARSER = argparse.ArgumentParser(
+        description="Find two entries summing to a target in files larger than RAM"
+    )
+    PARSER.add_argument("input_path", type=Path)
+    PARSER.add_argument("--target", type=int, default=2020)
+    PARSER.add_argument("--memory-budget", type=int, default=DEFAULT_MEMORY_BUDGET)
+    PARSER.add_argument("--workers", type=int)
+    PARSER.add_argument("--work-dir", type=Path)
+    ARGS = PARSER.parse_args()
+
+    PAIR = find_pair(
+        ARGS.input_path, ARGS.target, ARGS.memory_budget, ARGS.workers, ARGS.work_dir
+    )
+    print(PAIR[0] * PAIR[1] if PAIR else 0)
@@ -0,0 +1,134 @@
+import itertools
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from solutions.bits import iter_set_bits
+
+# Values spanning more than this fall back to hashing instead of bitsets
+MAX_BITSET_BITS = 1 << 27
+
+Combination = Tuple[int, ...]
+HalfSums = Dict[int, List[Tuple[int, ...]]]
+
+
+class KSumIndex:
+    """Sorted numbers indexed once for any number of k-sum queries
+
+    Pairs are found with one AND between the value bitset and its reverse,
+    shifted so that value a lines up with target - a, which checks every
+    candidate at once rather than one Python loop iteration per number.
+    """
+
+    def __init__(self, numbers: Iterable[int]):
+        self.numbers = sorted(numbers)
+        self.counts = Counter(self.numbers)
+        self.offset = self.numbers[0] if self.numbers else 0
+        self.width = self.numbers[-1] - self.offset + 1 if self.numbers else 0
+        self.bitset: Optional[int] = None
+        self.reversed_bitset = 0
+
+        if self.width <= MAX_BITSET_BITS:
+            forward = bytearray((self.width + 7) // 8)
+            backward = bytearray((self.width + 7) // 8)
+
+            for value in self.counts:
+                position = value - self.offset
+                forward[position // 8] |= 1 << (position % 8)
+                reversed_position = self.width - 1 - position
+                backward[reversed_position // 8] |= 1 << (reversed_position % 8)
+
+            self.bitset = int.from_bytes(forward, "little")
+            self.reversed_bitset = int.from_bytes(backward, "little")
+
+    def is_available(self, values: Sequence[int], used: Counter) -> bool:
+        needed = Counter(values)
+        needed.update(used)
+        return all(self.counts[value] >= count for value, count in needed.items())
+
+    def iter_pair_candidates(self, target: int) -> Iterator[Tuple[int, int]]:
+        if self.bitset is None:
+            for value in self.counts:
+                if target - value in self.counts and value <= target - value:
+                    yield value, target - value
+            return
+
+        # Pairs sum to somewhere in [2 * offset, 2 * (offset + width - 1)], and
+        # anything outside it would only shift the bitset by up to target bits
+        if not 0 <= target - 2 * self.offset <= 2 * (self.width - 1):
+            return
+
+        # Bit (width - 1 - a) of the reversed set moves to position target - a
+        shift = target - 2 * self.offset - (self.width - 1)
+        if shift >= 0:
+            aligned = self.reversed_bitset << shift
+        else:
+            aligned = self.reversed_bitset >> -shift
+
+        for position in iter_set_bits(self.bitset & aligned):
+            value = position + self.offset
+            if value > target - value:
+                break
+            yield value, target - value
+
+    def find_pair(
+        self, target: int, used: Optional[Counter] = None
+    ) -> Optional[Tuple[int, int]]:
+        for pair in self.iter_pair_candidates(target):
+            if self.is_available(pair, used or Counter()):
+                return pair
+
+        return None
+
+    def find_triple(self, target: int) -> Optional[Combination]:
+        for value in self.counts:
+            if pair := self.find_pair(target - value, Counter([value])):
+                return tuple(sorted((value, *pair)))
+
+        return None
+
+    def get_half_sums(self, size: int) -> HalfSums:
+        half_sums: HalfSums = defaultdict(list)
+
+        for indices in itertools.combinations(range(len(self.numbers)), size):
+            half_sums[sum(self.numbers[index] for index in indices)].append(indices)
+
+        return half_sums
+
+    def find_split(
+        self, target: int, k: int, half_sums: HalfSums
+    ) -> Optional[Combination]:
+        # The smaller half is enumerated and matched against the stored larger
+        # half, so k numbers cost O(n^(k/2)) rather than O(n^k)
+        for indices in itertools.combinations(range(len(self.numbers)), k // 2):
+            remainder = target - sum(self.numbers[index] for index in indices)
+
+            for other_indices in half_sums.get(remainder, ()):
+                if not set(indices).intersection(other_indices):
+                    return tuple(
+                        sorted(self.numbers[index] for index in indices + other_indices)
+                    )
+
+        return None
+
+    def find(self, target: int, k: int) -> Optional[Combination]:
+        return self.find_many((target,), k)[target]
+
+    def find_many(
+        self, targets: Iterable[int], k: int
+    ) -> Dict[int, Optional[Combination]]:
+        if k < 1:
+            raise ValueError(f"k must be at least 1, got {k}")
+
+        if k == 1:
+            return {
+                target: (target,) if target in self.counts else None
+                for target in targets
+            }
+        if k == 2:
+            return {target: self.find_pair(target) for target in targets}
+        if k == 3:
+            return {target: self.find_triple(target) for target in targets}
+
+        # Built once and shared by every target in the batch
+        half_sums = self.get_half_sums(k - k // 2)
+        return {target: self.find_split(target, k, half_sums) for target in targets}
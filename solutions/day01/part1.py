@@ -1,44 +1,45 @@
-def get_input():
-    with open("input.txt") as file_handle:
-        for num in file_handle.read().splitlines():
-            yield int(num)
+import functools
+import operator
+from typing import Dict, Iterable, Sequence
 
+from solutions.day01.ksum import KSumIndex
+from solutions.inputs import get_input
 
-target = 2020
+TARGET = 2020
 
 
-def part1(input_nums):
-    seen = set()
+def parse(input_lines: Iterable[str]) -> KSumIndex:
+    return KSumIndex(int(num) for num in input_lines)
 
-    for num in input_nums:
-        if target - num in seen:
-            return num * (target - num)
 
-        seen.add(num)
+def get_product(index: KSumIndex, target: int, k: int) -> int:
+    numbers = index.find(target, k)
+    return functools.reduce(operator.mul, numbers, 1) if numbers else 0
 
-    return 0
 
+def get_products(
+    index: KSumIndex, targets: Sequence[int], k: int = 2
+) -> Dict[int, int]:
+    return {
+        target: functools.reduce(operator.mul, numbers, 1) if numbers else 0
+        for target, numbers in index.find_many(targets, k).items()
+    }
 
-print(part1(get_input()))
 
+def part1(index: KSumIndex) -> int:
+    return get_product(index, TARGET, 2)
 
-def part2(input_nums):
-    sorted_nums = sorted(input_nums)
 
-    for index, current in enumerate(sorted_nums):
-        start_index = index
-        end_index = len(sorted_nums) - 1
-        goal = target - current
+def part2(index: KSumIndex) -> int:
+    return get_product(index, TARGET, 3)
 
-        while start_index != end_index:
-            total = sorted_nums[start_index] + sorted_nums[end_index]
 
-            if total > goal:
-                end_index -= 1
-            elif total < goal:
-                start_index += 1
-            else:
-                return current * sorted_nums[start_index] * sorted_nums[end_index]
+QUERIES = {
+    "products": get_products,
+}
 
 
-print(part2(get_input()))
+if __name__ == "__main__":
+    INDEX = parse(get_input(__file__))
+    print(part1(INDEX))
+    print(part2(INDEX))
@@ -0,0 +1,47 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from solutions.day02.part1 import ValidCounts, count_valid_file
+from solutions.inputs import get_line_ranges
+
+# More ranges than workers keeps every core busy when ranges run unevenly
+RANGES_PER_WORKER = 4
+
+
+def count_valid_parallel(
+    input_path: Path, workers: Optional[int] = None
+) -> ValidCounts:
+    """Validate a password file split into byte ranges across worker processes
+
+    Workers are only sent the path and their offsets. Each one maps the file
+    itself and sends back two counts, so no lines are ever pickled.
+    """
+    workers = workers or os.cpu_count() or 1
+    ranges = get_line_ranges(input_path, workers * RANGES_PER_WORKER)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(
+                count_valid_file,
+                [input_path] * len(ranges),
+                [start for start, _ in ranges],
+                [end for _, end in ranges],
+            )
+        )
+
+    return sum(counts[0] for counts in results), sum(counts[1] for counts in results)
+
+
+if __name__ == "__main__":
+    PARSER = argparse.ArgumentParser(
+        description="Count valid passwords under both policies using every core"
+    )
+    PARSER.add_argument("input_path", type=Path)
+    PARSER.add_argument("--workers", type=int)
+    ARGS = PARSER.parse_args()
+
+    for COUNT in count_valid_parallel(ARGS.input_path, ARGS.workers):
+        print(COUNT)
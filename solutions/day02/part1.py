@@ -1,43 +1,131 @@
+import itertools
+import operator
 import re
-from collections import Counter
+from array import array
 from dataclasses import dataclass
-from typing import Iterable
+from pathlib import Path
+from typing import Iterable, Optional, Sequence, Tuple
+
+from solutions.inputs import get_input, iter_chunks
+
+PATTERN = re.compile(rb"([0-9]+)-([0-9]+) ([a-z]): ([a-z]+)")
+
+ValidCounts = Tuple[int, int]
 
 
 @dataclass
-class Record:
-    minimum: int
-    maximum: int
-    character: str
-    password: str
+class Policies:
+    """One column per field, so both policies can be mapped over whole columns"""
+
+    minimums: array
+    maximums: array
+    characters: bytes
+    passwords: Sequence[bytes]
+
+
+def get_policies_by_pattern(data: bytes) -> Policies:
+    matches = PATTERN.findall(data)
+    if not matches:
+        return Policies(array("I"), array("I"), b"", [])
 
-    def __post_init__(self):
-        self.minimum = int(self.minimum)
-        self.maximum = int(self.maximum)
+    minimums, maximums, characters, passwords = zip(*matches)
 
+    return Policies(
+        array("I", map(int, minimums)),
+        array("I", map(int, maximums)),
+        b"".join(characters),
+        passwords,
+    )
+
+
+def get_policies(data: bytes) -> Policies:
+    # Well formed lines are always exactly three tokens, "1-3 a: abcde", which
+    # can be sliced into columns without running a regex over every line
+    tokens = data.split()
+    characters = b"".join(tokens[1::3])
+    ranges = b" ".join(tokens[0::3]).replace(b"-", b" ").split()
 
-PATTERN = r"([0-9]+)-([0-9]+) ([a-z]): ([a-z]+)"
+    if len(tokens) % 3 or characters[1::2] != b":" * (len(tokens) // 3):
+        return get_policies_by_pattern(data)
+    if len(ranges) != 2 * (len(tokens) // 3):
+        return get_policies_by_pattern(data)
+    # A malformed line like "x-3 b: cdefg" still has three tokens, and the
+    # regex skips it rather than failing the whole chunk
+    if not b"".join(ranges).isdigit():
+        return get_policies_by_pattern(data)
 
+    return Policies(
+        array("I", map(int, ranges[0::2])),
+        array("I", map(int, ranges[1::2])),
+        characters[0::2],
+        tokens[2::3],
+    )
 
-def get_data() -> Iterable[Record]:
-    with open("./input.txt") as file_handle:
-        for line in file_handle.read().splitlines():
-            if match := re.match(PATTERN, line):
-                groups = match.groups()
-                yield Record(int(groups[0]), int(groups[1]), groups[2], groups[3])
 
+def count_valid_by_count(policies: Policies) -> int:
+    # Every step maps a C function over whole columns, so no Python bytecode
+    # runs per password
+    counts = list(map(bytes.count, policies.passwords, policies.characters))
 
-def is_valid(record: Record) -> bool:
+    # The minimum never exceeds the maximum, so the two ways to fail are disjoint
     return (
-        record.minimum <= Counter(record.password)[record.character] <= record.maximum
+        len(counts)
+        - sum(map(operator.gt, policies.minimums, counts))
+        - sum(map(operator.gt, counts, policies.maximums))
     )
 
 
-def is_valid2(record: Record) -> bool:
-    return (record.password[record.minimum - 1] == record.character) ^ (
-        record.password[record.maximum - 1] == record.character
+def count_valid_by_position(policies: Policies) -> int:
+    # Counting over a one character window is 0 or 1 and can't index past the end
+    first_matches = map(
+        bytes.count,
+        policies.passwords,
+        policies.characters,
+        map(operator.sub, policies.minimums, itertools.repeat(1)),
+        policies.minimums,
+    )
+    second_matches = map(
+        bytes.count,
+        policies.passwords,
+        policies.characters,
+        map(operator.sub, policies.maximums, itertools.repeat(1)),
+        policies.maximums,
     )
+    return sum(map(operator.xor, first_matches, second_matches))
+
+
+def count_valid(policies: Policies) -> ValidCounts:
+    return count_valid_by_count(policies), count_valid_by_position(policies)
+
+
+def count_valid_file(
+    input_path: Path, start: int = 0, end: Optional[int] = None
+) -> ValidCounts:
+    """Count both policies chunk by chunk, holding one chunk's columns at once"""
+    count_valid_total = 0
+    position_valid_total = 0
+
+    for chunk in iter_chunks(input_path, start=start, end=end):
+        counts = count_valid(get_policies(chunk))
+        count_valid_total += counts[0]
+        position_valid_total += counts[1]
+
+    return count_valid_total, position_valid_total
+
+
+def parse(input_lines: Iterable[str]) -> Policies:
+    return get_policies("\n".join(input_lines).encode())
+
+
+def part1(policies: Policies) -> int:
+    return count_valid_by_count(policies)
+
+
+def part2(policies: Policies) -> int:
+    return count_valid_by_position(policies)
 
 
-print(sum(1 for record in get_data() if is_valid(record)))
-print(sum(1 for record in get_data() if is_valid2(record)))
+if __name__ == "__main__":
+    POLICIES = parse(get_input(__file__))
+    print(part1(POLICIES))
+    print(part2(POLICIES))
@@ -1,32 +1,62 @@
 import functools
+import math
 import operator
-from typing import Iterable, Tuple
+from dataclasses import dataclass
+from typing import Dict, Iterable, Sequence, Tuple
 
+from solutions.bits import get_strided_mask, popcount
+from solutions.inputs import get_input
 
-def get_input():
-    with open("input.txt") as file_handle:
-        return file_handle.read().splitlines()
+Slope = Tuple[int, int]
 
+TREE_TO_BIT = str.maketrans("#.", "10")
 
-lines = get_input()
 
+@dataclass
+class TreeMap:
+    width: int
+    height: int
+    # Bit r of columns[c] is set when there's a tree at row r, column c
+    columns: Sequence[int]
 
-def get_positions(
-    rows: int, cols: int, down: int, right: int
-) -> Iterable[Tuple[int, int]]:
-    for iteration, row in enumerate(range(0, rows, down)):
-        yield row, (iteration * right) % cols
 
+def get_tree_map(lines: Sequence[str]) -> TreeMap:
+    width = len(lines[0]) if lines else 0
+    grid = "".join(lines)
+
+    # Slicing the flattened grid pulls out whole columns without a Python loop
+    return TreeMap(
+        width,
+        len(lines),
+        [int(grid[col::width][::-1].translate(TREE_TO_BIT), 2) for col in range(width)],
+    )
+
+
+def get_tree_count(tree_map: TreeMap, down: int, right: int) -> int:
+    if down < 1:
+        raise ValueError(f"Slopes must go down at least one row, got {down}")
+    if not tree_map.width or not tree_map.height:
+        raise ValueError("The map has no squares to cross")
+
+    # Column k * right % width repeats every period steps, so the rows visited
+    # in any one column are evenly spaced and can be masked out all at once
+    period = tree_map.width // math.gcd(right, tree_map.width)
+    steps = (tree_map.height + down - 1) // down
+    mask = get_strided_mask(period * down, tree_map.height)
 
-def get_tree_count(down: int, right: int) -> int:
     return sum(
-        1
-        for row, col in get_positions(len(lines), len(lines[0]), down, right)
-        if lines[row][col] == "#"
+        popcount(
+            (tree_map.columns[(step * right) % tree_map.width] >> step * down) & mask
+        )
+        for step in range(min(period, steps))
     )
 
 
-print(get_tree_count(1, 3))
+def get_tree_counts(tree_map: TreeMap, slopes: Iterable[Slope]) -> Dict[Slope, int]:
+    return {
+        (down, right): get_tree_count(tree_map, down, right) for down, right in slopes
+    }
+
 
 inputs = (
     (1, 1),
@@ -36,4 +66,25 @@ inputs = (
     (2, 1),
 )
 
-print(functools.reduce(operator.mul, (get_tree_count(*pair) for pair in inputs)))
+
+def parse(input_lines: Iterable[str]) -> TreeMap:
+    return get_tree_map(list(input_lines))
+
+
+def part1(tree_map: TreeMap) -> int:
+    return get_tree_count(tree_map, 1, 3)
+
+
+def part2(tree_map: TreeMap) -> int:
+    return functools.reduce(operator.mul, get_tree_counts(tree_map, inputs).values())
+
+
+QUERIES = {
+    "tree_count": get_tree_count,
+}
+
+
+if __name__ == "__main__":
+    TREE_MAP = parse(get_input(__file__))
+    print(part1(TREE_MAP))
+    print(part2(TREE_MAP))
@@ -0,0 +1,63 @@
+import argparse
+import functools
+import operator
+from collections import defaultdict
+from typing import Dict, Iterable, List, Sequence
+
+from solutions.day03.solution import Slope, inputs
+from solutions.inputs import iter_stream_lines
+
+TREE = ord("#")
+
+
+def get_tree_counts(rows: Iterable[bytes], slopes: Sequence[Slope]) -> Dict[Slope, int]:
+    """Count trees on every slope in one sequential pass over the rows
+
+    Only the current row and one counter per slope are held, so the map
+    can be any height and can come from a pipe.
+    """
+    counts = dict.fromkeys(slopes, 0)
+    slopes_by_down: Dict[int, List[Slope]] = defaultdict(list)
+    for down, right in counts:
+        slopes_by_down[down].append((down, right))
+
+    for row_index, row in enumerate(rows):
+        if not row:
+            continue
+
+        for down, down_slopes in slopes_by_down.items():
+            # Rows between a slope's strides are never landed on
+            if row_index % down:
+                continue
+
+            step = row_index // down
+            for slope in down_slopes:
+                if row[(step * slope[1]) % len(row)] == TREE:
+                    counts[slope] += 1
+
+    return counts
+
+
+def parse_slope(slope: str) -> Slope:
+    down, right = slope.split(",")
+    return int(down), int(right)
+
+
+if __name__ == "__main__":
+    PARSER = argparse.ArgumentParser(
+        description="Count trees on many slopes while reading the map only once"
+    )
+    PARSER.add_argument("input_path", help="Map file, or - to read stdin")
+    PARSER.add_argument(
+        "--slope",
+        type=parse_slope,
+        action="append",
+        dest="slopes",
+        help="DOWN,RIGHT; may be repeated, defaults to the part 2 slopes",
+    )
+    ARGS = PARSER.parse_args()
+
+    COUNTS = get_tree_counts(iter_stream_lines(ARGS.input_path), ARGS.slopes or inputs)
+    for (DOWN, RIGHT), COUNT in COUNTS.items():
+        print(f"{DOWN},{RIGHT}: {COUNT}")
+    print(functools.reduce(operator.mul, COUNTS.values()))
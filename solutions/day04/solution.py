@@ -1,88 +1,70 @@
 import itertools
-import string
-from typing import Dict, Iterable, List, Tuple
-
-EXPECTED_KEYS = [
-    "byr",
-    "iyr",
-    "eyr",
-    "hgt",
-    "hcl",
-    "ecl",
-    "pid",
-]
-
-
-def get_input() -> Iterable[str]:
-    with open("input.txt") as file_handle:
-        yield from file_handle.read().splitlines()
-
-
-def split_field(field: str) -> Tuple[str, str]:
-    pair = field.split(":")
-    assert len(pair) == 2
-    return (pair[0], pair[1])
-
-
-def get_record(input_lines: Iterable[str]) -> Iterable[List[str]]:
-    for line in itertools.takewhile(lambda x: x, input_lines):
-        yield line.split(" ")
-
-
-def process_record(input_lines: Iterable[str]) -> Dict[str, str]:
-    return dict(
-        split_field(field) for field in itertools.chain(*get_record(input_lines))
+import re
+from typing import Iterable, Iterator, List, Tuple
+
+from solutions.inputs import get_input
+
+BATCH_LINES = 1 << 16
+
+PassportCounts = Tuple[int, int]
+
+# The ranges are spelled out in the patterns, so no value needs int() or a
+# separate length check
+FIELD_RULES = {
+    "byr": r"19[2-9][0-9]|200[0-2]",
+    "iyr": r"201[0-9]|2020",
+    "eyr": r"202[0-9]|2030",
+    "hgt": r"(?:1[5-8][0-9]|19[0-3])cm|(?:59|6[0-9]|7[0-6])in",
+    "hcl": r"#[0-9a-fA-F]{6}",
+    "ecl": r"amb|blu|brn|gry|grn|hzl|oth",
+    "pid": r"[0-9]{9}",
+}
+FIELD_COUNT = len(FIELD_RULES)
+
+# Each key in a record matches on its own, or together with its value when the
+# value passes, so findall reduces a record to " byr:1980 hgt iyr:2015 ..."
+FIELD_PATTERN = re.compile(
+    r"\n| (?:"
+    + "|".join(
+        rf"{key}(?=:)(?::(?:{rule})(?!\S))?" for key, rule in FIELD_RULES.items()
     )
+    + ")"
+)
 
 
-def get_records(input_lines: Iterable[str]):
-    while record := process_record(input_lines):
-        yield record
-
+def iter_record_blocks(input_lines: Iterable[str]) -> Iterator[str]:
+    """Batches of whole records, one per line with a space before every field"""
+    lines = iter(input_lines)
 
-print(
-    sum(
-        1
-        for record in get_records(get_input())
-        if set(EXPECTED_KEYS).issubset(set(record.keys()))
-    )
-)
+    while batch := list(itertools.islice(lines, BATCH_LINES)):
+        # Finish off the record the batch ended in the middle of
+        if batch[-1]:
+            batch.extend(itertools.takewhile(bool, lines))
 
+        block = "\n".join(batch).replace("\n\n", "\0").replace("\n", " ")
+        yield " " + block.replace("\0", " \n ")
 
-def is_inside_range(value, lower_bound, upper_bound, length):
-    return (
-        len(value) == length
-        and value.isnumeric()
-        and (lower_bound <= int(value) <= upper_bound)
-    )
 
+def count_with_every_field(records: List[str], marker: str) -> int:
+    return list(map(str.count, records, itertools.repeat(marker))).count(FIELD_COUNT)
 
-def is_valid_record(record: Dict[str, str]) -> bool:
-    if not set(EXPECTED_KEYS).issubset(set(record.keys())):
-        return False
 
-    if record["ecl"] not in ("amb", "blu", "brn", "gry", "grn", "hzl", "oth"):
-        return False
+def count_passports(input_lines: Iterable[str]) -> PassportCounts:
+    """Count complete and valid passports together in one pass over the lines
 
-    suffix, height = record["hgt"][-2:], record["hgt"][:-2]
-    if suffix == "cm" and not is_inside_range(height, 150, 193, 3):
-        return False
-    if suffix == "in" and not is_inside_range(height, 59, 76, 2):
-        return False
-    if suffix not in ("in", "cm"):
-        return False
+    Keys are assumed to appear at most once per passport, as they do in the
+    puzzle input, so counting them is enough to tell that none are missing.
+    """
+    complete_total = 0
+    valid_total = 0
 
-    if len(record["hcl"]) != 7 or not set(record["hcl"][1:]).issubset(
-        set(string.hexdigits)
-    ):
-        return False
+    for block in iter_record_blocks(input_lines):
+        records = "".join(FIELD_PATTERN.findall(block)).split("\n")
+        # Every field found starts with a space, and every one that passed has a colon
+        complete_total += count_with_every_field(records, " ")
+        valid_total += count_with_every_field(records, ":")
 
-    return (
-        is_inside_range(record["byr"], 1920, 2002, 4)
-        and is_inside_range(record["iyr"], 2010, 2020, 4)
-        and is_inside_range(record["eyr"], 2020, 2030, 4)
-        and is_inside_range(record["pid"], 0, 999999999, 9)
-    )
+    return complete_total, valid_total
 
 
 VALID_RECORDS = """
@@ -100,9 +82,6 @@ eyr:2022
 iyr:2010 hgt:158cm hcl:#b6652a ecl:blu byr:1944 eyr:2021 pid:093154719
 """
 
-for test_record in get_records(VALID_RECORDS.splitlines()):
-    assert is_valid_record(test_record)
-
 INVALID_RECORDS = """
 eyr:1972 cid:100
 hcl:#18171d ecl:amb hgt:170 pid:186cm iyr:2018 byr:1926
@@ -119,8 +98,23 @@ eyr:2038 hcl:74454a iyr:2023
 pid:3556412378 byr:2007
 """
 
-for test_record in get_records(INVALID_RECORDS.splitlines()):
-    assert not is_valid_record(test_record)
 
+def parse(input_lines: Iterable[str]) -> PassportCounts:
+    return count_passports(input_lines)
+
+
+def part1(counts: PassportCounts) -> int:
+    return counts[0]
+
+
+def part2(counts: PassportCounts) -> int:
+    return counts[1]
+
+
+if __name__ == "__main__":
+    assert count_passports(VALID_RECORDS.splitlines()) == (4, 4)
+    assert count_passports(INVALID_RECORDS.splitlines())[1] == 0
 
-print(sum(1 for record in get_records(get_input()) if is_valid_record(record)))
+    COUNTS = parse(get_input(__file__))
+    print(part1(COUNTS))
+    print(part2(COUNTS))
@@ -1,54 +1,139 @@
-import functools
+import collections
 import itertools
-import math
-import operator
-from typing import Iterable, Tuple
+from dataclasses import dataclass
+from typing import Iterable, List
 
+from solutions.bits import get_set_bits, iter_set_bits
+from solutions.inputs import get_input
 
-def get_input() -> Iterable[str]:
-    with open("input.txt") as file_handle:
-        yield from file_handle.read().splitlines()
+# Each character halves the remaining rows or columns, picking the upper half
+# on B and R, which is exactly one binary digit of the seat ID
+PASS_TO_BITS = str.maketrans("FBLR", "0101")
+SEAT_TO_BIT = bytes.maketrans(b"\x00\x01", b"01")
 
 
-def lower_bound(lower: int, upper: int) -> Tuple[int, int]:
-    return (lower, (upper + lower) // 2)
+@dataclass(frozen=True)
+class Aircraft:
+    row_bits: int = 7
+    column_bits: int = 3
 
+    @property
+    def pass_length(self) -> int:
+        return self.row_bits + self.column_bits
 
-def upper_bound(lower: int, upper: int) -> Tuple[int, int]:
-    return (math.ceil((upper + lower) / 2), upper)
+    @property
+    def seat_count(self) -> int:
+        return 1 << self.pass_length
 
 
-def get_seat_id(row: int, col: int) -> int:
-    return row * 8 + col
+AIRCRAFT = Aircraft()
 
 
-TRANSITIONS = {
-    "F": lower_bound,
-    "B": upper_bound,
-    "R": upper_bound,
-    "L": lower_bound,
-}
+def get_seat_ids(passes: str, aircraft: Aircraft = AIRCRAFT) -> List[int]:
+    """Decode whitespace separated passes, with one C-level call per pass"""
+    digits = passes.translate(PASS_TO_BITS).split()
+
+    if set(map(len, digits)) - {aircraft.pass_length}:
+        raise ValueError(f"Passes must be {aircraft.pass_length} characters long")
+
+    return list(map(int, digits, itertools.repeat(2)))
+
+
+def get_seat_bitmap(seat_ids: Iterable[int], aircraft: Aircraft = AIRCRAFT) -> int:
+    """Bit n is set when seat n is taken"""
+    seats = bytearray(aircraft.seat_count)
+    collections.deque(map(seats.__setitem__, seat_ids, itertools.repeat(1)), maxlen=0)
+
+    # Reversed so that seat 0 ends up as the lowest bit
+    return int(seats[::-1].translate(SEAT_TO_BIT), 2)
+
+
+class SeatIndex:
+    """Taken seats as the bits of one int, so every query is a few shifts and masks
+
+    Seats can be taken and released in place, and queries always reflect the
+    latest state without rebuilding anything.
+    """
+
+    def __init__(self, seat_ids: Iterable[int] = (), aircraft: Aircraft = AIRCRAFT):
+        self.aircraft = aircraft
+        self.all_seats = (1 << aircraft.seat_count) - 1
+        self.taken = get_seat_bitmap(seat_ids, aircraft)
+
+    def get_seat_bit(self, seat_id: int) -> int:
+        if not 0 <= seat_id < self.aircraft.seat_count:
+            raise ValueError(f"No seat {seat_id} on this aircraft")
+
+        return 1 << seat_id
+
+    def take(self, seat_id: int) -> None:
+        self.taken |= self.get_seat_bit(seat_id)
+
+    def release(self, seat_id: int) -> None:
+        self.taken &= ~self.get_seat_bit(seat_id)
 
+    def is_taken(self, seat_id: int) -> bool:
+        return bool(self.taken & self.get_seat_bit(seat_id))
 
-def process_string(initial_bounds: Tuple[int, int], transitions: str) -> int:
-    for transition in transitions:
-        initial_bounds = TRANSITIONS[transition](*initial_bounds)
+    @property
+    def max_seat_id(self) -> int:
+        return self.taken.bit_length() - 1
 
-    assert initial_bounds[0] == initial_bounds[1]
-    return initial_bounds[0]
+    @property
+    def free(self) -> int:
+        return self.all_seats & ~self.taken
 
+    @property
+    def enclosed_free(self) -> int:
+        # Seats at the very front and back only have one neighbour, so never count
+        return self.free & (self.taken << 1) & (self.taken >> 1)
 
-seating_positions = (
-    (process_string((0, 127), input_str[:-3]), process_string((0, 7), input_str[-3:]),)
-    for input_str in get_input()
-)
+    def get_free_seats(self) -> List[int]:
+        return get_set_bits(self.free)
 
-seat_ids = [get_seat_id(*seat) for seat in seating_positions]
+    def get_enclosed_free_seats(self) -> List[int]:
+        return get_set_bits(self.enclosed_free)
+
+    def get_free_blocks(self, length: int) -> List[int]:
+        """First seat of every run of length free seats in a row, overlaps included"""
+        if length < 1:
+            raise ValueError(f"Blocks need at least one seat, got {length}")
+
+        # After each step bit n says whether span seats from n are all free, and
+        # the span doubles, so long blocks take O(log length) shifts
+        starts = self.free
+        span = 1
+        while span < length:
+            step = min(span, length - span)
+            starts &= starts >> step
+            span += step
+
+        return get_set_bits(starts)
+
+
+def parse(input_lines: Iterable[str]) -> SeatIndex:
+    return SeatIndex(get_seat_ids("\n".join(input_lines)))
+
+
+def part1(index: SeatIndex) -> int:
+    return index.max_seat_id
+
+
+def part2(index: SeatIndex) -> int:
+    for seat_id in iter_set_bits(index.enclosed_free):
+        return seat_id
+
+    raise ValueError("No free seat between two taken seats")
+
+
+QUERIES = {
+    "free_seats": SeatIndex.get_free_seats,
+    "enclosed_free_seats": SeatIndex.get_enclosed_free_seats,
+    "free_blocks": SeatIndex.get_free_blocks,
+}
 
-print(max(seat_ids))
 
-print(
-    functools.reduce(
-        operator.xor, itertools.chain(seat_ids, range(min(seat_ids), max(seat_ids) + 1))
-    )
-)
+if __name__ == "__main__":
+    INDEX = parse(get_input(__file__))
+    print(part1(INDEX))
+    print(part2(INDEX))
@@ -1,24 +1,65 @@
-import itertools
-from typing import Iterable, List, Set
+import functools
+import operator
+import string
+from typing import Iterable, Tuple
 
+from solutions.bits import popcount
+from solutions.inputs import get_input
 
-def get_input() -> Iterable[str]:
-    with open("input.txt") as file_handle:
-        yield from file_handle.read().splitlines()
+# One bit per question, so a group's answers combine with | and &
+QUESTION_BITS = {
+    question: 1 << index for index, question in enumerate(string.ascii_lowercase)
+}
+ALL_QUESTIONS = (1 << len(QUESTION_BITS)) - 1
 
+AnswerCounts = Tuple[int, int]
 
-def get_record(input_lines: Iterable[str]) -> Iterable[Set[str]]:
-    for line in itertools.takewhile(lambda x: x, input_lines):
-        yield set(line)
 
+def get_answers(line: str) -> int:
+    return functools.reduce(operator.or_, map(QUESTION_BITS.__getitem__, line), 0)
 
-def get_records(input_lines: Iterable[str]) -> Iterable[List[Set[str]]]:
-    while record := list(get_record(input_lines)):
-        yield record
 
+def count_answers(input_lines: Iterable[str]) -> AnswerCounts:
+    """Count questions anyone and everyone answered, in one pass over the lines"""
+    anyone_total = 0
+    everyone_total = 0
+    anyone = 0
+    everyone = ALL_QUESTIONS
+    in_group = False
 
-# print(sum(len(record_set) for record_set in get_records(get_input(), process_record)))
-print(sum(len(set.union(*record_set)) for record_set in get_records(get_input())))
-print(
-    sum(len(set.intersection(*record_set)) for record_set in get_records(get_input()))
-)
+    for line in input_lines:
+        if line:
+            answers = get_answers(line)
+            anyone |= answers
+            everyone &= answers
+            in_group = True
+        elif in_group:
+            anyone_total += popcount(anyone)
+            everyone_total += popcount(everyone)
+            anyone = 0
+            everyone = ALL_QUESTIONS
+            in_group = False
+
+    if in_group:
+        anyone_total += popcount(anyone)
+        everyone_total += popcount(everyone)
+
+    return anyone_total, everyone_total
+
+
+def parse(input_lines: Iterable[str]) -> AnswerCounts:
+    return count_answers(input_lines)
+
+
+def part1(counts: AnswerCounts) -> int:
+    return counts[0]
+
+
+def part2(counts: AnswerCounts) -> int:
+    return counts[1]
+
+
+if __name__ == "__main__":
+    COUNTS = parse(get_input(__file__))
+    print(part1(COUNTS))
+    print(part2(COUNTS))
@@ -0,0 +1,258 @@
+from array import array
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from solutions.bits import popcount
+
+Rule = Iterable[Tuple[int, str]]
+Memo = List[Optional[int]]
+
+
+def fill_memo(
+    memo: Memo,
+    bag_id: int,
+    get_inputs: Callable[[int], Iterable[int]],
+    compute: Callable[[int], int],
+) -> int:
+    """Fill in bag_id and any missing inputs it needs, depth first without recursion
+
+    A bag is only computed once every one of its inputs is, which makes this a
+    topological pass over just the part of the graph that's missing.
+    """
+    stack = [bag_id]
+    expanded: Set[int] = set()
+
+    while stack:
+        current = stack[-1]
+        if memo[current] is not None:
+            stack.pop()
+            continue
+
+        missing = [
+            input_id for input_id in get_inputs(current) if memo[input_id] is None
+        ]
+        if missing:
+            # Inputs pushed last time round are done unless one leads back here
+            if current in expanded:
+                raise ValueError("Bag rules contain a cycle")
+
+            expanded.add(current)
+            stack.extend(missing)
+            continue
+
+        memo[current] = compute(current)
+        stack.pop()
+
+    return memo[bag_id]  # type: ignore
+
+
+def clear_memo(
+    memo: Memo, bag_ids: Iterable[int], get_next: Callable[[int], Iterable[int]]
+) -> None:
+    # A missing entry's dependents are always missing too, so the walk can stop
+    # at the first one it meets
+    stack = [bag_id for bag_id in bag_ids if memo[bag_id] is not None]
+
+    while stack:
+        bag_id = stack.pop()
+        if memo[bag_id] is not None:
+            memo[bag_id] = None
+            stack.extend(get_next(bag_id))
+
+
+class BagGraph:
+    """Bag rules with colors interned to dense integer IDs
+
+    Each rule's contents sit in one contiguous run of the children and counts
+    arrays, from starts[bag] up to ends[bag], so no per-edge objects are kept.
+    Totals and ancestor sets are memoized per bag, and editing a rule only
+    clears the entries that depend on it. Replaced runs are left in place until
+    they outnumber the live edges, when the arrays are compacted.
+    """
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self.has_rule = bytearray()
+        self.starts = array("I")
+        self.ends = array("I")
+        self.children = array("I")
+        self.counts = array("I")
+        # Edges in runs that no rule points at any more
+        self.garbage = 0
+        # Lists rather than sets, as most bags only have a handful of holders
+        self.parents: List[List[int]] = []
+        self.totals: Memo = []
+        self.ancestor_bitsets: Memo = []
+
+    @classmethod
+    def from_tokens(cls, tokens: Iterable[Tuple[str, str, str]]) -> "BagGraph":
+        """Load a whole rule file at once, writing edges straight into the arrays
+
+        Tokens are (holder, "", "") to start a rule and ("", count, color) for
+        each bag inside it, in file order.
+        """
+        graph = cls()
+        ids, intern, parents = graph.ids, graph.intern, graph.parents
+        add_child, add_count = graph.children.append, graph.counts.append
+        holder_id = -1
+
+        for holder, count, name in tokens:
+            if holder:
+                if holder_id >= 0:
+                    graph.ends[holder_id] = len(graph.children)
+
+                holder_id = intern(holder)
+                # The last rule for a color wins, so an earlier one's edges go
+                if graph.has_rule[holder_id]:
+                    for child_id in set(graph.get_children(holder_id)[0]):
+                        parents[child_id].remove(holder_id)
+                    graph.garbage += graph.ends[holder_id] - graph.starts[holder_id]
+
+                graph.has_rule[holder_id] = 1
+                graph.starts[holder_id] = len(graph.children)
+            elif holder_id >= 0:
+                # Most colors are already interned, so skip the method call
+                if (child_id := ids.get(name)) is None:
+                    child_id = intern(name)
+
+                add_child(child_id)
+                add_count(int(count))
+                # A color listed twice in one rule would have just been added
+                if not parents[child_id] or parents[child_id][-1] != holder_id:
+                    parents[child_id].append(holder_id)
+
+        if holder_id >= 0:
+            graph.ends[holder_id] = len(graph.children)
+        if graph.garbage * 2 > len(graph.children):
+            graph.compact()
+
+        return graph
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def intern(self, name: str) -> int:
+        if (bag_id := self.ids.get(name)) is None:
+            bag_id = self.ids[name] = len(self.names)
+            self.names.append(name)
+            self.has_rule.append(0)
+            self.starts.append(0)
+            self.ends.append(0)
+            self.parents.append([])
+            self.totals.append(None)
+            self.ancestor_bitsets.append(None)
+
+        return bag_id
+
+    def get_id(self, name: str) -> int:
+        if (bag_id := self.ids.get(name)) is None:
+            raise KeyError(f"No rule mentions {name} bags")
+
+        return bag_id
+
+    def get_children(self, bag_id: int) -> Tuple[array, array]:
+        start, end = self.starts[bag_id], self.ends[bag_id]
+        return self.children[start:end], self.counts[start:end]
+
+    def set_rule(self, holder: str, contents: Rule) -> None:
+        holder_id = self.intern(holder)
+        old_children = set(self.get_children(holder_id)[0])
+        self.garbage += self.ends[holder_id] - self.starts[holder_id]
+        start = len(self.children)
+
+        for count, name in contents:
+            self.children.append(self.intern(name))
+            self.counts.append(count)
+
+        # A replaced rule's old run is left unreferenced until there's enough
+        # of them to be worth copying every live run down over
+        self.has_rule[holder_id] = 1
+        self.starts[holder_id] = start
+        self.ends[holder_id] = len(self.children)
+        new_children = set(self.get_children(holder_id)[0])
+        if self.garbage * 2 > len(self.children):
+            self.compact()
+
+        for child_id in old_children - new_children:
+            self.parents[child_id].remove(holder_id)
+        for child_id in new_children - old_children:
+            self.parents[child_id].append(holder_id)
+
+        # Totals change for the holder and everything around it, but only bags
+        # that gained or lost this holder, and the bags inside them, change
+        # ancestors
+        clear_memo(self.totals, (holder_id,), self.parents.__getitem__)
+        clear_memo(
+            self.ancestor_bitsets,
+            old_children ^ new_children,
+            lambda bag_id: self.get_children(bag_id)[0],
+        )
+
+    def compact(self) -> None:
+        """Copy every live run into fresh arrays, in bag order"""
+        children, counts = array("I"), array("I")
+
+        for bag_id in range(len(self.names)):
+            start, end = self.starts[bag_id], self.ends[bag_id]
+            self.starts[bag_id] = len(children)
+            children.extend(self.children[start:end])
+            counts.extend(self.counts[start:end])
+            self.ends[bag_id] = len(children)
+
+        self.children, self.counts = children, counts
+        self.garbage = 0
+
+    def add_rule(self, holder: str, contents: Rule) -> None:
+        if holder in self.ids and self.has_rule[self.ids[holder]]:
+            raise ValueError(f"There's already a rule for {holder} bags")
+
+        self.set_rule(holder, contents)
+
+    def replace_rule(self, holder: str, contents: Rule) -> None:
+        if not self.has_rule[self.get_id(holder)]:
+            raise KeyError(f"No rule for {holder} bags")
+
+        self.set_rule(holder, contents)
+
+    def remove_rule(self, holder: str) -> None:
+        self.replace_rule(holder, ())
+        self.has_rule[self.ids[holder]] = 0
+
+    def compute_total(self, bag_id: int) -> int:
+        children, counts = self.get_children(bag_id)
+        return sum(
+            count * (1 + self.totals[child_id])  # type: ignore
+            for child_id, count in zip(children, counts)
+        )
+
+    def get_total(self, name: str) -> int:
+        """Bags held inside a bag, filling in only the totals it's missing"""
+        return fill_memo(
+            self.totals,
+            self.get_id(name),
+            lambda bag_id: self.get_children(bag_id)[0],
+            self.compute_total,
+        )
+
+    def compute_ancestor_bitset(self, bag_id: int) -> int:
+        ancestor_bitset = 0
+        for parent_id in self.parents[bag_id]:
+            parent_bitset: int = self.ancestor_bitsets[parent_id]  # type: ignore
+            ancestor_bitset |= parent_bitset | (1 << parent_id)
+
+        return ancestor_bitset
+
+    def get_ancestor_bitset(self, bag_id: int) -> int:
+        """Bit p is set when bag p can eventually hold this bag"""
+        return fill_memo(
+            self.ancestor_bitsets,
+            bag_id,
+            self.parents.__getitem__,
+            self.compute_ancestor_bitset,
+        )
+
+    def count_ancestors(self, name: str) -> int:
+        return popcount(self.get_ancestor_bitset(self.get_id(name)))
+
+    def count_ancestors_many(self, names: Iterable[str]) -> Dict[str, int]:
+        return {name: self.count_ancestors(name) for name in names}
@@ -1,11 +1,19 @@
-import functools
 import itertools
+import operator
 import re
-from dataclasses import dataclass
-from typing import Dict, Iterable, Sequence, Tuple
+from typing import Dict, Iterable, Iterator, Sequence, Tuple
 
-HOLDER_PATTERN = r"^([a-z]+ [a-z]+)"
-CONTENTS_PATTERN = r"([0-9]+) ([a-z]+ [a-z]+) bag"
+from solutions.day07.graph import BagGraph
+from solutions.inputs import get_input
+
+BATCH_LINES = 1 << 12
+
+# One scan of the whole file picks out every holder and every bag inside one
+RULE_PATTERN = re.compile(
+    r"^([a-z]+ [a-z]+) bags contain|([0-9]+) ([a-z]+ [a-z]+) bag", re.MULTILINE
+)
+
+RuleToken = Tuple[str, str, str]
 
 TEST_INPUT = """\
 light red bags contain 1 bright white bag, 2 muted yellow bags.
@@ -31,23 +39,6 @@ dark violet bags contain no other bags.
 """
 
 
-@dataclass
-class Contents:
-    count: int
-    name: str
-
-    def __hash__(self):
-        return hash(str(self.count) + self.name)
-
-
-BagsToContents = Iterable[Tuple[str, Sequence[Contents]]]
-
-
-def get_input() -> Iterable[str]:
-    with open("input.txt") as file_handle:
-        yield from file_handle.read().splitlines()
-
-
 def get_test_input() -> Iterable[str]:
     return iter(TEST_INPUT.splitlines())
 
@@ -56,70 +47,59 @@ def get_test_input2() -> Iterable[str]:
     return iter(TEST_INPUT2.splitlines())
 
 
-def get_contents(input_line: str) -> Iterable[Contents]:
-    for match in re.finditer(CONTENTS_PATTERN, input_line):
-        number, bag_type = match.groups()
-        yield Contents(int(number), bag_type)
+TARGET_BAG = "shiny gold"
 
 
-def get_holder(input_line: str) -> str:
-    if match := re.match(HOLDER_PATTERN, input_line):
-        return match.group(1)
+def iter_rule_tokens(input_lines: Iterable[str]) -> Iterator[RuleToken]:
+    lines = iter(input_lines)
 
-    raise Exception(f"No match for {input_line}")
+    # Rules never span lines, so batches bound memory without splitting any
+    while batch := list(itertools.islice(lines, BATCH_LINES)):
+        tokens = RULE_PATTERN.findall("\n".join(batch))
+        holder_count = sum(map(bool, map(operator.itemgetter(0), tokens)))
 
+        if holder_count != len(batch) - batch.count(""):
+            raise ValueError("Every line should start with the bag its rule is for")
 
-def get_bags_to_contents(input_lines: Iterable[str]) -> BagsToContents:
-    for line in input_lines:
-        yield get_holder(line), tuple(get_contents(line))
+        yield from tokens
 
 
-def get_parent_bags(bags_to_contents: BagsToContents) -> Iterable[Tuple[str, str]]:
-    for holder_name, contents in bags_to_contents:
-        for bag in contents:
-            yield bag.name, holder_name
+def parse(input_lines: Iterable[str]) -> BagGraph:
+    return BagGraph.from_tokens(iter_rule_tokens(input_lines))
 
 
-def get_parent_bag_lookup(
-    sorted_parent_bags: Iterable[Tuple[str, str]]
-) -> Dict[str, Sequence[str]]:
-    return {
-        key: list(g[1] for g in group)
-        for key, group in itertools.groupby(sorted_parent_bags, key=lambda x: x[0])
-    }
+def count_containers(graph: BagGraph, bag: str) -> int:
+    return graph.count_ancestors(bag)
 
 
-def get_parents(
-    parent_bags_lookup: Dict[str, Sequence[str]], current_bag: str
-) -> Iterable[str]:
-    yield from parent_bags_lookup[current_bag]
+def count_containers_many(graph: BagGraph, bags: Sequence[str]) -> Dict[str, int]:
+    return graph.count_ancestors_many(bags)
 
-    for parent_bag in parent_bags_lookup[current_bag]:
-        if parent_bag in parent_bags_lookup:
-            yield from get_parents(parent_bags_lookup, parent_bag)
 
+def count_contents(graph: BagGraph, bag: str) -> int:
+    return graph.get_total(bag)
 
-TARGET_BAG = "shiny gold"
-BAGS_TO_CONTENTS = dict(get_bags_to_contents(get_test_input()))
-PARENT_BAGS = get_parent_bags(BAGS_TO_CONTENTS.items())
-PARENT_BAG_LOOKUP = get_parent_bag_lookup(sorted(PARENT_BAGS))
 
-print(len(set(get_parents(PARENT_BAG_LOOKUP, TARGET_BAG))))
+def part1(graph: BagGraph) -> int:
+    return count_containers(graph, TARGET_BAG)
+
 
+def part2(graph: BagGraph) -> int:
+    return count_contents(graph, TARGET_BAG)
 
-class HDict(dict):
-    def __hash__(self):
-        return hash(frozenset(self.items()))
 
+QUERIES = {
+    "containers": count_containers,
+    "containers_many": count_containers_many,
+    "contents": count_contents,
+}
 
-# Hilariously, the cache actually slows this down substantially
-@functools.lru_cache(maxsize=100, typed=False)
-def get_bag_counts(bags_to_contents: Dict[str, Sequence[Contents]], current_bag):
-    return 1 + sum(
-        bag.count * get_bag_counts(bags_to_contents, bag.name)
-        for bag in bags_to_contents[current_bag]
-    )
 
+if __name__ == "__main__":
+    assert part1(parse(get_test_input())) == 4
+    assert part2(parse(get_test_input())) == 32
+    assert part2(parse(get_test_input2())) == 126
 
-BAGS_TO_CONTENTS2 = HDict(get_bags_to_contents(get_input()))
-print(get_bag_counts(BAGS_TO_CONTENTS2, TARGET_BAG) - 1)
+    GRAPH = parse(get_input(__file__))
+    print(part1(GRAPH))
+    print(part2(GRAPH))
@@ -0,0 +1,136 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+from solutions.day08.vm import ACC, JMP, Program
+
+UNSEEN = 0
+ON_PATH = 1
+RESOLVED = 2
+
+
+@dataclass
+class Repair:
+    index: int
+    accumulator: int
+
+
+def get_exit_accumulators(program: Program) -> List[Optional[int]]:
+    """Accumulator added on the way to terminating from each instruction
+
+    None marks instructions that loop or jump out of the program. Every
+    instruction has exactly one successor, so following each unseen
+    path until it meets a resolved instruction visits everything once.
+    """
+    size = len(program)
+    opcodes, arguments = program.opcodes, program.arguments
+    exits: List[Optional[int]] = [None] * (size + 1)
+    exits[size] = 0
+    states = bytearray(size + 1)
+    states[size] = RESOLVED
+
+    for start in range(size):
+        path = []
+        ptr = start
+
+        while 0 <= ptr <= size and states[ptr] == UNSEEN:
+            states[ptr] = ON_PATH
+            path.append(ptr)
+            ptr += arguments[ptr] if opcodes[ptr] == JMP else 1
+
+        # Meeting the path itself again means it loops
+        if 0 <= ptr <= size and states[ptr] == RESOLVED:
+            exit_accumulator = exits[ptr]
+        else:
+            exit_accumulator = None
+
+        for ptr in reversed(path):
+            if exit_accumulator is not None and opcodes[ptr] == ACC:
+                exit_accumulator += arguments[ptr]
+
+            exits[ptr] = exit_accumulator
+            states[ptr] = RESOLVED
+
+    return exits
+
+
+def get_run_joins(program: Program, run_steps: List[int]) -> List[int]:
+    """Step at which the path from each instruction first meets the original run
+
+    run_steps holds that step for instructions on the run and -1 elsewhere, and
+    paths that never meet the run stay at -1. Resolved with the same walk as
+    get_exit_accumulators.
+    """
+    size = len(program)
+    opcodes, arguments = program.opcodes, program.arguments
+    joins = list(run_steps)
+    states = bytearray(UNSEEN if step < 0 else RESOLVED for step in run_steps)
+
+    for start in range(size):
+        path = []
+        ptr = start
+
+        while 0 <= ptr <= size and states[ptr] == UNSEEN:
+            states[ptr] = ON_PATH
+            path.append(ptr)
+            ptr += arguments[ptr] if opcodes[ptr] == JMP else 1
+
+        join = joins[ptr] if 0 <= ptr <= size and states[ptr] == RESOLVED else -1
+        for ptr in path:
+            joins[ptr] = join
+            states[ptr] = RESOLVED
+
+    return joins
+
+
+def find_repairs(program: Program) -> List[Repair]:
+    """Every single nop/jmp swap that makes the program terminate, by index, in O(n)
+
+    Only instructions on the original run can change it. Swapping one of them
+    works when the other branch leads to the end without coming back through
+    the swapped instruction. When the run loops that's guaranteed, since the
+    swapped instruction is part of the loop.
+    """
+    exits = get_exit_accumulators(program)
+    size = len(program)
+    opcodes, arguments = program.opcodes, program.arguments
+    run_steps = [-1] * (size + 1)
+    repairs = []
+    swapped_ptrs = []
+    ptr = accumulator = step = 0
+
+    while 0 <= ptr < size and run_steps[ptr] < 0:
+        run_steps[ptr] = step
+        step += 1
+        opcode, argument = opcodes[ptr], arguments[ptr]
+
+        if opcode == ACC:
+            accumulator += argument
+            ptr += 1
+            continue
+
+        swapped = ptr + 1 if opcode == JMP else ptr + argument
+        if 0 <= swapped <= size and (exit_accumulator := exits[swapped]) is not None:
+            repairs.append(Repair(ptr, accumulator + exit_accumulator))
+            swapped_ptrs.append(swapped)
+
+        ptr += argument if opcode == JMP else 1
+
+    if ptr != size:
+        return sorted(repairs, key=lambda repair: repair.index)
+
+    # The run already terminates, so the other branch comes back through the
+    # swapped instruction exactly when it meets the run at or before it.
+    # Swapping anything off the run leaves it terminating just the same.
+    run_steps[size] = step
+    joins = get_run_joins(program, run_steps)
+    repairs = [
+        repair
+        for repair, swapped in zip(repairs, swapped_ptrs)
+        if joins[swapped] > run_steps[repair.index]
+    ]
+    repairs.extend(
+        Repair(index, accumulator)
+        for index in range(size)
+        if run_steps[index] < 0 and opcodes[index] != ACC
+    )
+    return sorted(repairs, key=lambda repair: repair.index)
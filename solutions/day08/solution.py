@@ -1,6 +1,12 @@
+import dataclasses
+from array import array
 from dataclasses import dataclass
 from enum import Enum, unique
-from typing import Callable, Dict, Iterable, Sequence, Set, Union
+from typing import Any, Dict, Iterable, List, Optional
+
+from solutions.day08 import vm
+from solutions.day08.repair import find_repairs
+from solutions.inputs import get_input
 
 HOLDER_PATTERN = r"^([a-z]+ [a-z]+)"
 CONTENTS_PATTERN = r"([0-9]+) ([a-z]+ [a-z]+) bag"
@@ -31,21 +37,6 @@ class Instruction:
     count: int
 
 
-@dataclass
-class State:
-    instruction_ptr: int
-    current_accumulator: int
-    instructions: Sequence[Instruction]
-
-    def __str__(self):
-        return f"Ptr: {self.instruction_ptr} Acc: {self.current_accumulator}"
-
-
-def get_input() -> Iterable[str]:
-    with open("input.txt") as file_handle:
-        yield from file_handle.read().splitlines()
-
-
 def get_test_input() -> Iterable[str]:
     return iter(TEST_INPUT.splitlines())
 
@@ -56,100 +47,125 @@ def get_instructions(input_lines: Iterable[str]) -> Iterable[Instruction]:
         yield Instruction(Operation(operation), int(val))
 
 
-def acc(count: int, state: State):
-    return State(
-        state.instruction_ptr + 1, state.current_accumulator + count, state.instructions
-    )
+OPCODES: Dict[Operation, int] = {
+    Operation.NOP: vm.NOP,
+    Operation.ACC: vm.ACC,
+    Operation.JMP: vm.JMP,
+}
 
+DEFAULT_HOT_LIMIT = 10
 
-def nop(_: int, state: State) -> State:
-    return State(
-        state.instruction_ptr + 1, state.current_accumulator, state.instructions
-    )
+FLIP_OPCODES: Dict[int, int] = {
+    vm.NOP: vm.JMP,
+    vm.JMP: vm.NOP,
+}
 
 
-def jmp(count: int, state: State) -> State:
-    return State(
-        state.instruction_ptr + count, state.current_accumulator, state.instructions
-    )
+def compile_program(instructions: Iterable[Instruction]) -> vm.Program:
+    opcodes = bytearray()
+    arguments = array("q")
 
+    for instruction in instructions:
+        opcodes.append(OPCODES[instruction.operation])
+        arguments.append(instruction.count)
 
-JUMP_TABLE: Dict[Operation, Callable[[int, State], State]] = {
-    Operation.NOP: nop,
-    Operation.ACC: acc,
-    Operation.JMP: jmp,
-}
+    return vm.Program(bytes(opcodes), arguments)
 
-FLIP_OPERATION: Dict[Operation, Operation] = {
-    Operation.NOP: Operation.JMP,
-    Operation.JMP: Operation.NOP,
-}
 
+def get_toggled_run(
+    program: vm.Program, index: int, tracer: Optional[vm.Tracer] = None
+) -> vm.Run:
+    if not 0 <= index < len(program):
+        raise ValueError(f"No instruction {index} in a program of {len(program)}")
+    if program.opcodes[index] not in FLIP_OPCODES:
+        raise ValueError(f"Cannot toggle the acc instruction at {index}")
+
+    opcodes = bytearray(program.opcodes)
+    opcodes[index] = FLIP_OPCODES[opcodes[index]]
+    return vm.run(program, opcodes=bytes(opcodes), tracer=tracer)
+
+
+def get_terminating_accumulator(program: vm.Program) -> int:
+    # The first repair by position, if more than one swap happens to work
+    if repairs := find_repairs(program):
+        return min(repairs, key=lambda repair: repair.index).accumulator
+
+    raise ValueError("No single toggle makes the program terminate")
 
-def next_state(current_state: State) -> State:
-    current_instruction = current_state.instructions[current_state.instruction_ptr]
 
-    return JUMP_TABLE[current_instruction.operation](
-        current_instruction.count, current_state
-    )
+def get_repairs(program: vm.Program) -> List[Dict[str, int]]:
+    return [dataclasses.asdict(repair) for repair in find_repairs(program)]
 
 
-def get_last_state(current_state: State, visited: Set[int]) -> State:
-    if current_state.instruction_ptr in visited:
-        return current_state
+def get_loop_state(program: vm.Program) -> Dict[str, int]:
+    last_run = vm.run(program)
+    return {
+        "instruction_ptr": last_run.instruction_ptr,
+        "accumulator": last_run.accumulator,
+    }
 
-    return get_last_state(
-        next_state(current_state), visited.union({current_state.instruction_ptr})
-    )
 
+def get_toggled_accumulator(program: vm.Program, index: int) -> Optional[int]:
+    toggled_run = get_toggled_run(program, index)
+    return toggled_run.accumulator if toggled_run.terminated else None
 
-def terminates(current_state: State, visited: Set[int]) -> Union[int, None]:
-    instruction_length = len(current_state.instructions)
-    if current_state.instruction_ptr in visited:
-        return None
-    if current_state.instruction_ptr > instruction_length:
-        return None
-    if current_state.instruction_ptr == instruction_length:
-        return current_state.current_accumulator
 
-    return terminates(
-        next_state(current_state), visited.union({current_state.instruction_ptr})
-    )
+def get_trace(
+    program: vm.Program,
+    history_size: int = vm.DEFAULT_HISTORY_SIZE,
+    scan_toggles: bool = False,
+    hot_limit: int = DEFAULT_HOT_LIMIT,
+) -> Dict[str, Any]:
+    """Trace the program, and optionally every toggled copy of it too
 
+    One run stops before any instruction repeats, so instruction counts only
+    pick out a hot loop once the toggled runs of a repair scan are added in.
+    """
+    tracer = vm.Tracer(history_size)
+    vm.run(program, tracer=tracer)
 
-INSTRUCTIONS = list(get_instructions(get_input()))
-START_STATE = State(0, 0, INSTRUCTIONS)
+    if scan_toggles:
+        for index, opcode in enumerate(program.opcodes):
+            if opcode in FLIP_OPCODES:
+                get_toggled_run(program, index, tracer)
 
-print(get_last_state(START_STATE, set()))
+    trace = tracer.to_json()
+    trace["hot_instructions"] = [
+        {"index": index, "count": count}
+        for index, count in tracer.get_hot_instructions(hot_limit)
+    ]
+    return trace
 
-assert terminates(START_STATE, set()) is None
-assert terminates(State(len(INSTRUCTIONS) + 1, 0, INSTRUCTIONS), set()) is None
-assert terminates(State(len(INSTRUCTIONS), 0, INSTRUCTIONS), set()) is not None
 
+def parse(input_lines: Iterable[str]) -> vm.Program:
+    return compile_program(get_instructions(input_lines))
 
-def toggle(
-    target_index: int, instructions: Iterable[Instruction]
-) -> Iterable[Instruction]:
-    for index, instruction in enumerate(instructions):
-        if index == target_index:
-            yield Instruction(FLIP_OPERATION[instruction.operation], instruction.count)
-        else:
-            yield instruction
 
+def part1(program: vm.Program) -> int:
+    return vm.run(program).accumulator
 
-def get_terminating_accumulator(starting_instructions: Sequence[Instruction]) -> int:
-    for index, instruction in enumerate(starting_instructions):
-        if instruction.operation == Operation.ACC:
-            continue
 
-        return_value = terminates(
-            State(0, 0, list(toggle(index, starting_instructions))), set()
-        )
+def part2(program: vm.Program) -> int:
+    return get_terminating_accumulator(program)
+
+
+QUERIES = {
+    "loop_state": get_loop_state,
+    "toggled_accumulator": get_toggled_accumulator,
+    "repairs": get_repairs,
+    "trace": get_trace,
+}
+
 
-        if return_value is not None:
-            return return_value
+if __name__ == "__main__":
+    assert part1(parse(get_test_input())) == 5
+    assert part2(parse(get_test_input())) == 8
 
-    raise AssertionError
+    PROGRAM = parse(get_input(__file__))
 
+    assert not vm.run(PROGRAM).terminated
+    assert not vm.run(PROGRAM, len(PROGRAM) + 1).terminated
+    assert vm.run(PROGRAM, len(PROGRAM)).terminated
 
-print(get_terminating_accumulator(INSTRUCTIONS))
+    print(part1(PROGRAM))
+    print(part2(PROGRAM))
@@ -0,0 +1,163 @@
+import dataclasses
+import json
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+NOP = 0
+ACC = 1
+JMP = 2
+OPCODE_NAMES = ("nop", "acc", "jmp")
+
+DEFAULT_HISTORY_SIZE = 64
+
+
+@dataclass
+class Program:
+    """One opcode byte and one argument per instruction"""
+
+    opcodes: bytes
+    arguments: array
+
+    def __len__(self) -> int:
+        return len(self.opcodes)
+
+
+@dataclass
+class Run:
+    instruction_ptr: int
+    accumulator: int
+    terminated: bool
+
+
+@dataclass
+class Loop:
+    instruction_ptr: int
+    length: int
+
+
+class Tracer:
+    """Execution statistics gathered from every run that's handed this tracer"""
+
+    def __init__(self, history_size: int = DEFAULT_HISTORY_SIZE):
+        self.runs = 0
+        self.steps = 0
+        self.instruction_counts: List[int] = []
+        self.opcode_counts = [0] * len(OPCODE_NAMES)
+        self.loops: List[Loop] = []
+        # The most recent (step, instruction_ptr, accumulator) states, oldest first
+        self.history: Deque[Tuple[int, int, int]] = deque(maxlen=history_size)
+
+    def get_instruction_counts(self, size: int) -> List[int]:
+        if len(self.instruction_counts) < size:
+            self.instruction_counts.extend([0] * (size - len(self.instruction_counts)))
+
+        return self.instruction_counts
+
+    def get_hot_instructions(self, limit: int) -> List[Tuple[int, int]]:
+        executed = [
+            (index, count)
+            for index, count in enumerate(self.instruction_counts)
+            if count
+        ]
+        return sorted(executed, key=lambda item: item[1], reverse=True)[:limit]
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "steps": self.steps,
+            "opcode_counts": dict(zip(OPCODE_NAMES, self.opcode_counts)),
+            "instruction_counts": {
+                str(index): count
+                for index, count in enumerate(self.instruction_counts)
+                if count
+            },
+            "loops": [dataclasses.asdict(loop) for loop in self.loops],
+            "history": [
+                {"step": step, "instruction_ptr": ptr, "accumulator": accumulator}
+                for step, ptr, accumulator in self.history
+            ],
+        }
+
+    def write_json(self, output_path: Path) -> None:
+        with open(output_path, "w") as file_handle:
+            json.dump(self.to_json(), file_handle, indent=2)
+
+
+def run_traced(
+    program: Program,
+    instruction_ptr: int,
+    accumulator: int,
+    opcodes: bytes,
+    tracer: Tracer,
+) -> Run:
+    """The same loop as run, with every step recorded in tracer"""
+    arguments = program.arguments
+    size = len(opcodes)
+    instruction_counts = tracer.get_instruction_counts(size)
+    opcode_counts = tracer.opcode_counts
+    record_state = tracer.history.append
+    # Step at which each instruction first ran, so a loop's length is known
+    first_steps = [0] * size
+    step = 0
+
+    while 0 <= instruction_ptr < size and not first_steps[instruction_ptr]:
+        step += 1
+        first_steps[instruction_ptr] = step
+        opcode = opcodes[instruction_ptr]
+        instruction_counts[instruction_ptr] += 1
+        opcode_counts[opcode] += 1
+        record_state((step, instruction_ptr, accumulator))
+
+        if opcode == JMP:
+            instruction_ptr += arguments[instruction_ptr]
+            continue
+        if opcode == ACC:
+            accumulator += arguments[instruction_ptr]
+        instruction_ptr += 1
+
+    if 0 <= instruction_ptr < size:
+        tracer.loops.append(
+            Loop(instruction_ptr, step + 1 - first_steps[instruction_ptr])
+        )
+
+    tracer.runs += 1
+    tracer.steps += step
+    return Run(instruction_ptr, accumulator, instruction_ptr == size)
+
+
+def run(
+    program: Program,
+    instruction_ptr: int = 0,
+    accumulator: int = 0,
+    opcodes: Optional[bytes] = None,
+    tracer: Optional[Tracer] = None,
+) -> Run:
+    """Run until an instruction would repeat or the pointer leaves the program
+
+    opcodes can stand in for the program's own, so that a patched copy can be
+    run without copying the arguments too. Passing a tracer switches to a
+    separate recording loop, so untraced runs pay nothing for it.
+    """
+    opcodes = program.opcodes if opcodes is None else opcodes
+    if tracer is not None:
+        return run_traced(program, instruction_ptr, accumulator, opcodes, tracer)
+
+    arguments = program.arguments
+    size = len(opcodes)
+    visited = bytearray(size)
+
+    while 0 <= instruction_ptr < size and not visited[instruction_ptr]:
+        visited[instruction_ptr] = 1
+        opcode = opcodes[instruction_ptr]
+
+        if opcode == JMP:
+            instruction_ptr += arguments[instruction_ptr]
+            continue
+        if opcode == ACC:
+            accumulator += arguments[instruction_ptr]
+        instruction_ptr += 1
+
+    return Run(instruction_ptr, accumulator, instruction_ptr == size)
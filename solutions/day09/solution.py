@@ -1,5 +1,7 @@
 from typing import Iterable, Sequence, Tuple
 
+from solutions.inputs import get_input
+
 TEST_INPUT = """\
 35
 20
@@ -24,11 +26,6 @@ TEST_INPUT = """\
 """
 
 
-def get_input() -> Iterable[str]:
-    with open("input.txt") as file_handle:
-        yield from file_handle.read().splitlines()
-
-
 def get_test_input() -> Iterable[str]:
     return iter(TEST_INPUT.splitlines())
 
@@ -90,7 +87,20 @@ def get_contiguous_numbers_imperative(
                 return min(current_slice), max(current_slice)
 
 
-INPUT_SEQUENCE = get_input_sequence(get_input())
-INCORRECT_VALUE = get_incorrect_value(INPUT_SEQUENCE, 25)
+def parse(input_lines: Iterable[str]) -> Sequence[int]:
+    return get_input_sequence(input_lines)
+
+
+def part1(input_sequence: Sequence[int]) -> int:
+    return get_incorrect_value(input_sequence, 25)
+
+
+def part2(input_sequence: Sequence[int]) -> int:
+    incorrect_value = get_incorrect_value(input_sequence, 25)
+    return sum(get_contiguous_numbers_imperative(incorrect_value, input_sequence))
+
 
-print(sum(get_contiguous_numbers_imperative(INCORRECT_VALUE, INPUT_SEQUENCE)))
+if __name__ == "__main__":
+    INPUT_SEQUENCE = parse(get_input(__file__))
+    print(part1(INPUT_SEQUENCE))
+    print(part2(INPUT_SEQUENCE))
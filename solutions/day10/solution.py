@@ -1,6 +1,8 @@
 from collections import Counter
 from typing import Iterable, Sequence
 
+from solutions.inputs import get_input
+
 TEST_INPUT = """\
 16
 10
@@ -16,11 +18,6 @@ TEST_INPUT = """\
 """
 
 
-def get_input() -> Iterable[str]:
-    with open("input.txt") as file_handle:
-        yield from file_handle.read().splitlines()
-
-
 def get_test_input() -> Iterable[str]:
     return iter(TEST_INPUT.splitlines())
 
@@ -45,8 +42,20 @@ def get_permutations(sorted_int: Sequence[int]) -> int:
     return permutations[-1]
 
 
-ADAPTERS = get_sorted_input(get_input())
-COUNT = Counter(get_first_differences(ADAPTERS))
+def parse(input_lines: Iterable[str]) -> Sequence[int]:
+    return get_sorted_input(input_lines)
+
+
+def part1(adapters: Sequence[int]) -> int:
+    count = Counter(get_first_differences(adapters))
+    return count[1] * (count[3] + 1)
+
+
+def part2(adapters: Sequence[int]) -> int:
+    return get_permutations(adapters)
+
 
-print(COUNT[1] * (COUNT[3] + 1))
-print(get_permutations(ADAPTERS))
+if __name__ == "__main__":
+    ADAPTERS = parse(get_input(__file__))
+    print(part1(ADAPTERS))
+    print(part2(ADAPTERS))
@@ -4,6 +4,8 @@ from enum import Enum, unique
 from functools import partial
 from typing import Callable, Dict, Iterable, Tuple
 
+from solutions.inputs import get_input
+
 TEST_INPUT = """\
 L.LL.LL.LL
 LLLLLLL.LL
@@ -31,11 +33,6 @@ Neighbors = Iterable[Position]
 GetNeighborsFunc = Callable[[int, int, Board], Neighbors]
 
 
-def get_input() -> Iterable[str]:
-    with open("input.txt") as file_handle:
-        yield from file_handle.read().splitlines()
-
-
 def get_test_input() -> Iterable[str]:
     return iter(TEST_INPUT.splitlines())
 
@@ -128,19 +125,50 @@ def get_final_board(initial_board: Board, state_transition_func) -> Board:
     return new_board
 
 
-INITIAL_BOARD = get_board(get_input())
-FINAL_BOARD = get_final_board(
-    INITIAL_BOARD,
-    partial(get_new_state, threshold=4, get_neighbors_func=get_neighbors),
-)
+def get_board_after(initial_board: Board, state_transition_func, rounds: int) -> Board:
+    board = initial_board
+
+    for _ in range(rounds):
+        if (new_board := get_new_board(board, state_transition_func)) == board:
+            break
+        board = new_board
 
-FINAL_ALIVE = Counter(FINAL_BOARD.values())
-print(FINAL_ALIVE[State.FULL])
+    return board
 
-FINAL_BOARD2 = get_final_board(
-    INITIAL_BOARD,
-    partial(get_new_state, threshold=5, get_neighbors_func=get_visible_neighbors),
+
+def count_occupied(board: Board) -> int:
+    return Counter(board.values())[State.FULL]
+
+
+ADJACENT_RULE = partial(get_new_state, threshold=4, get_neighbors_func=get_neighbors)
+VISIBLE_RULE = partial(
+    get_new_state, threshold=5, get_neighbors_func=get_visible_neighbors
 )
+RULES = {1: ADJACENT_RULE, 2: VISIBLE_RULE}
+
+
+def count_occupied_after(initial_board: Board, rounds: int, part: int = 1) -> int:
+    return count_occupied(get_board_after(initial_board, RULES[part], rounds))
+
+
+def parse(input_lines: Iterable[str]) -> Board:
+    return get_board(input_lines)
+
+
+def part1(initial_board: Board) -> int:
+    return count_occupied(get_final_board(initial_board, ADJACENT_RULE))
+
+
+def part2(initial_board: Board) -> int:
+    return count_occupied(get_final_board(initial_board, VISIBLE_RULE))
+
+
+QUERIES = {
+    "occupied_after": count_occupied_after,
+}
+
 
-FINAL_ALIVE2 = Counter(FINAL_BOARD2.values())
-print(FINAL_ALIVE2[State.FULL])
+if __name__ == "__main__":
+    INITIAL_BOARD = parse(get_input(__file__))
+    print(part1(INITIAL_BOARD))
+    print(part2(INITIAL_BOARD))
@@ -4,7 +4,9 @@ import re
 from dataclasses import dataclass
 from enum import Enum, unique
 from functools import reduce, singledispatch
-from typing import Dict, Iterable, Tuple, Union
+from typing import Dict, Iterable, Sequence, Tuple, Union
+
+from solutions.inputs import get_input
 
 INSTRUCTION_PATTERN = r"([A-Z])([0-9]+)"
 
@@ -74,11 +76,6 @@ def add_tuples(tuple1: Tuple[int, int], tuple2: Tuple[int, int]) -> Tuple[int, i
     return (tuple1[0] + tuple2[0], tuple1[1] + tuple2[1])
 
 
-def get_input() -> Iterable[str]:
-    with open("input.txt") as file_handle:
-        yield from file_handle.read().splitlines()
-
-
 def get_test_input() -> Iterable[str]:
     return iter(TEST_INPUT.splitlines())
 
@@ -160,15 +157,6 @@ def get_final_state(initial_state: State, instructions: Iterable[Instruction]) -
     return reduce(_do_operation, instructions, initial_state)
 
 
-INITIAL_STATE = State(Direction.EAST, (0, 0))
-INSTRUCTIONS = get_instructions(get_input())
-FINAL_STATE = get_final_state(INITIAL_STATE, INSTRUCTIONS)
-
-print(FINAL_STATE)
-print(abs(FINAL_STATE.position[0]) + abs(FINAL_STATE.position[1]))
-print()
-
-
 @dataclass
 class States:
     boat_state: State
@@ -236,15 +224,30 @@ def get_final_state_wp(
     return reduce(_do_operation_wp, instructions, initial_states)
 
 
-INSTRUCTIONS = get_instructions(get_input())
-INITIAL_STATE = State(Direction.NONE, (0, 0))
-INITIAL_WP_STATE = State(Direction.NONE, (10, 1))
-FINAL_BOAT_STATES = get_final_state_wp(
-    States(INITIAL_STATE, INITIAL_WP_STATE), INSTRUCTIONS
-)
+def parse(input_lines: Iterable[str]) -> Sequence[Instruction]:
+    return list(get_instructions(input_lines))
+
+
+def part1(instructions: Sequence[Instruction]) -> int:
+    initial_state = State(Direction.EAST, (0, 0))
+    final_state = get_final_state(initial_state, instructions)
+
+    return abs(final_state.position[0]) + abs(final_state.position[1])
+
+
+def part2(instructions: Sequence[Instruction]) -> int:
+    initial_state = State(Direction.NONE, (0, 0))
+    initial_wp_state = State(Direction.NONE, (10, 1))
+    final_boat_states = get_final_state_wp(
+        States(initial_state, initial_wp_state), instructions
+    )
+
+    return abs(final_boat_states.boat_state.position[0]) + abs(
+        final_boat_states.boat_state.position[1]
+    )
+
 
-print(FINAL_BOAT_STATES)
-print(
-    abs(FINAL_BOAT_STATES.boat_state.position[0])
-    + abs(FINAL_BOAT_STATES.boat_state.position[1])
-)
+if __name__ == "__main__":
+    INSTRUCTIONS = parse(get_input(__file__))
+    print(part1(INSTRUCTIONS))
+    print(part2(INSTRUCTIONS))
@@ -3,6 +3,8 @@ from dataclasses import dataclass
 from functools import reduce
 from typing import Iterable, Sequence, Tuple
 
+from solutions.inputs import get_input
+
 TEST_INPUT = """\
 939
 7,13,x,x,59,x,31,19
@@ -25,11 +27,6 @@ class Notes:
                 yield int(bus) - index, int(bus)
 
 
-def get_input() -> Iterable[str]:
-    with open("input.txt") as file_handle:
-        yield from file_handle.read().splitlines()
-
-
 def get_test_input() -> Iterable[str]:
     return iter(TEST_INPUT.splitlines())
 
@@ -50,12 +47,6 @@ def get_next_bus(notes: Notes) -> Tuple[int, int]:
     raise AssertionError
 
 
-NOTES = get_notes(get_input())
-NEXT_BUS = get_next_bus(NOTES)
-
-print(NEXT_BUS[0] * NEXT_BUS[1])
-
-
 # Functions from Rosetta
 
 
@@ -84,5 +75,21 @@ def mul_inv(a: int, b: int) -> int:
     return x1
 
 
-remainders, moduli = zip(*NOTES.get_bus_offsets())
-print(chinese_remainder(moduli, remainders))
+def parse(input_lines: Iterable[str]) -> Notes:
+    return get_notes(input_lines)
+
+
+def part1(notes: Notes) -> int:
+    next_bus = get_next_bus(notes)
+    return next_bus[0] * next_bus[1]
+
+
+def part2(notes: Notes) -> int:
+    remainders, moduli = zip(*notes.get_bus_offsets())
+    return chinese_remainder(moduli, remainders)
+
+
+if __name__ == "__main__":
+    NOTES = parse(get_input(__file__))
+    print(part1(NOTES))
+    print(part2(NOTES))
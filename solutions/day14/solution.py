@@ -5,6 +5,8 @@ from dataclasses import dataclass, field
 from functools import reduce
 from typing import Dict, Iterable, Sequence, Tuple, TypeVar
 
+from solutions.inputs import get_input
+
 MEMORY_PATTERN = r"mem\[([0-9]+)\] = ([0-9]+)"
 
 TEST_INPUT = """\
@@ -43,11 +45,6 @@ class Mask:
         ]
 
 
-def get_input() -> Iterable[str]:
-    with open("input.txt") as file_handle:
-        yield from file_handle.read().splitlines()
-
-
 def get_test_input() -> Iterable[str]:
     return iter(TEST_INPUT.splitlines())
 
@@ -92,8 +89,6 @@ def get_memory_dict(input_lines: Iterable[str], current_mask: Mask) -> Dict[int,
 
 
 INITIAL_MASK = Mask(0, 0xFFFFFFFFF, tuple())
-MEMORY_DICT = get_memory_dict(get_test_input(), INITIAL_MASK)
-print(sum(MEMORY_DICT.values()))
 
 
 def get_memory_dict_part2(
@@ -114,5 +109,19 @@ def get_memory_dict_part2(
     return memory_values
 
 
-MEMORY_DICT = get_memory_dict_part2(get_input(), INITIAL_MASK)
-print(sum(MEMORY_DICT.values()))
+def parse(input_lines: Iterable[str]) -> Sequence[str]:
+    return list(input_lines)
+
+
+def part1(input_lines: Sequence[str]) -> int:
+    return sum(get_memory_dict(input_lines, INITIAL_MASK).values())
+
+
+def part2(input_lines: Sequence[str]) -> int:
+    return sum(get_memory_dict_part2(input_lines, INITIAL_MASK).values())
+
+
+if __name__ == "__main__":
+    INPUT_LINES = parse(get_input(__file__))
+    print(part1(INPUT_LINES))
+    print(part2(INPUT_LINES))
@@ -1,9 +1,7 @@
 from collections import defaultdict, deque
-from typing import Dict, MutableSequence, Sequence
+from typing import Dict, Iterable, MutableSequence, Sequence
 
-
-def get_input() -> Sequence[int]:
-    return (0, 14, 6, 20, 1, 4)
+from solutions.inputs import get_input
 
 
 def get_test_input() -> Sequence[int]:
@@ -28,5 +26,19 @@ def get_final_number_spoken(input_sequence: Sequence[int], num_turns: int) -> in
     return last_spoken
 
 
-print(get_final_number_spoken(get_input(), 2020))
-print(get_final_number_spoken(get_input(), 30000000))
+def parse(input_lines: Iterable[str]) -> Sequence[int]:
+    return tuple(int(num) for line in input_lines for num in line.split(","))
+
+
+def part1(input_sequence: Sequence[int]) -> int:
+    return get_final_number_spoken(input_sequence, 2020)
+
+
+def part2(input_sequence: Sequence[int]) -> int:
+    return get_final_number_spoken(input_sequence, 30000000)
+
+
+if __name__ == "__main__":
+    INPUT_SEQUENCE = parse(get_input(__file__))
+    print(part1(INPUT_SEQUENCE))
+    print(part2(INPUT_SEQUENCE))
@@ -0,0 +1,113 @@
+import json
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from solutions.bench import PhaseResult, to_json
+
+DEFAULT_BASELINE_PATH = Path(__file__).parent.parent / "benchmarks" / "baseline.json"
+DEFAULT_TOLERANCE = 0.10
+# Sub-millisecond phases jitter by more than 10% on their own
+DEFAULT_MIN_DELTA_S = 0.001
+
+ResultKey = Tuple[str, str, int]
+
+
+@dataclass
+class Regression:
+    day: str
+    phase: str
+    scale: int
+    baseline_s: float
+    current_s: Optional[float]
+    error: Optional[str] = None
+
+    def __str__(self):
+        where = f"{self.day} {self.phase} at {self.scale}x"
+        if self.current_s is None:
+            return f"{where} failed: {self.error}"
+
+        change = self.current_s / self.baseline_s - 1
+        return (
+            f"{where}: {self.baseline_s * 1000:.2f}ms -> "
+            f"{self.current_s * 1000:.2f}ms ({change:+.0%})"
+        )
+
+
+def get_result_key(result: Dict[str, Any]) -> ResultKey:
+    return result["day"], result["phase"], result["scale"]
+
+
+def load_baseline(baseline_path: Path) -> Dict[ResultKey, Dict[str, Any]]:
+    if not baseline_path.exists():
+        return {}
+
+    with open(baseline_path) as file_handle:
+        return {
+            get_result_key(result): result
+            for result in json.load(file_handle)["results"]
+        }
+
+
+def find_regressions(
+    results: Sequence[PhaseResult],
+    baseline: Dict[ResultKey, Dict[str, Any]],
+    tolerance: float = DEFAULT_TOLERANCE,
+    min_delta_s: float = DEFAULT_MIN_DELTA_S,
+) -> List[Regression]:
+    regressions = []
+
+    for result in results:
+        expected = baseline.get((result.day, result.phase, result.scale))
+        if not expected or expected["median_s"] is None:
+            continue
+
+        baseline_s = expected["median_s"]
+        if result.error or math.isnan(result.median_s):
+            regressions.append(
+                Regression(
+                    result.day,
+                    result.phase,
+                    result.scale,
+                    baseline_s,
+                    None,
+                    result.error,
+                )
+            )
+            continue
+
+        # Both limits have to be crossed, so tiny phases don't trip on noise
+        delta_s = result.median_s - baseline_s
+        if delta_s > baseline_s * tolerance and delta_s > min_delta_s:
+            regressions.append(
+                Regression(
+                    result.day, result.phase, result.scale, baseline_s, result.median_s
+                )
+            )
+
+    return regressions
+
+
+def find_missing(
+    results: Sequence[PhaseResult], baseline: Dict[ResultKey, Dict[str, Any]]
+) -> List[ResultKey]:
+    """Phases the baseline has nothing to compare against"""
+    return [
+        (result.day, result.phase, result.scale)
+        for result in results
+        if (result.day, result.phase, result.scale) not in baseline
+    ]
+
+
+def update_baseline(baseline_path: Path, results: Sequence[PhaseResult]) -> None:
+    # Entries for days that weren't rerun are kept as they were
+    baseline = load_baseline(baseline_path)
+    updated = to_json(results)
+    baseline.update({get_result_key(result): result for result in updated["results"]})
+    updated["results"] = [baseline[key] for key in sorted(baseline)]
+
+    baseline_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(baseline_path, "w") as file_handle:
+        json.dump(updated, file_handle, indent=2)
+        file_handle.write("\n")
@@ -0,0 +1,111 @@
+import mmap
+import os
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, Union
+
+INPUT_FILENAME = "input.txt"
+DEFAULT_CHUNK_BYTES = 1 << 20
+
+Buffer = Union[bytes, mmap.mmap]
+PathLike = Union[str, Path]
+
+
+@contextmanager
+def map_input(input_path: PathLike) -> Iterator[Buffer]:
+    with open(input_path, "rb") as file_handle:
+        # Empty files can't be mapped, but there's nothing to copy either
+        if os.fstat(file_handle.fileno()).st_size == 0:
+            yield b""
+            return
+
+        with mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def iter_line_spans(buffer: Buffer) -> Iterator[Tuple[int, int]]:
+    start = 0
+    size = len(buffer)
+
+    while start < size:
+        end = buffer.find(b"\n", start)
+        if end == -1:
+            end = size
+
+        stop = end - 1 if end > start and buffer[end - 1] == ord("\r") else end
+        yield start, stop
+        start = end + 1
+
+
+def iter_line_bytes(input_path: PathLike) -> Iterator[bytes]:
+    with map_input(input_path) as buffer:
+        for start, stop in iter_line_spans(buffer):
+            yield buffer[start:stop]
+
+
+def iter_lines(input_path: PathLike, encoding: str = "ascii") -> Iterator[str]:
+    for line in iter_line_bytes(input_path):
+        yield line.decode(encoding)
+
+
+def iter_stream_lines(input_path: PathLike) -> Iterator[bytes]:
+    """Lines read strictly in order, so pipes and stdin ("-") work too"""
+    if str(input_path) == "-":
+        yield from (line.rstrip(b"\r\n") for line in sys.stdin.buffer)
+        return
+
+    with open(input_path, "rb") as file_handle:
+        yield from (line.rstrip(b"\r\n") for line in file_handle)
+
+
+def iter_chunks(
+    input_path: PathLike,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> Iterator[bytes]:
+    """Blocks of whole lines, for parsers that split many lines per call
+
+    start and end should sit on line boundaries, as from get_line_ranges.
+    """
+    with map_input(input_path) as buffer:
+        size = len(buffer) if end is None else min(end, len(buffer))
+
+        while start < size:
+            stop = buffer.rfind(b"\n", start, start + chunk_bytes) + 1
+            if stop <= start:
+                # A single line longer than the chunk is returned whole
+                stop = buffer.find(b"\n", start + chunk_bytes, size) + 1 or size
+            if start + chunk_bytes >= size:
+                stop = size
+
+            yield buffer[start:stop]
+            start = stop
+
+
+def get_line_ranges(input_path: PathLike, count: int) -> List[Tuple[int, int]]:
+    """Split a file into at most count byte ranges that each end after a newline"""
+    with map_input(input_path) as buffer:
+        size = len(buffer)
+        boundaries = [0]
+
+        for index in range(1, count):
+            stop = buffer.find(b"\n", max(size * index // count, boundaries[-1])) + 1
+            if stop == 0:
+                break
+            if stop > boundaries[-1]:
+                boundaries.append(stop)
+
+        if boundaries[-1] < size:
+            boundaries.append(size)
+
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def get_input_path(day_file: PathLike) -> Path:
+    return Path(day_file).parent / INPUT_FILENAME
+
+
+def get_input(day_file: PathLike) -> Iterator[str]:
+    return iter_lines(get_input_path(day_file))
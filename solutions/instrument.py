@@ -0,0 +1,129 @@
+import cProfile
+import dataclasses
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from solutions.inputs import PathLike, iter_lines
+from solutions.registry import Solver
+
+
+@dataclass
+class PhaseStats:
+    day: str
+    phase: str
+    wall_s: float
+    cpu_s: float
+    # Change in live interpreter memory blocks across the phase, so objects
+    # allocated and freed within it cancel out. The standard library keeps no
+    # running count of every allocation to report instead
+    net_allocated_blocks: int
+    peak_bytes: Optional[int]
+    profile_path: Optional[str]
+
+
+class Instrumenter:
+    """Records timings and memory for every phase called through it"""
+
+    def __init__(self, trace_memory: bool = True, profile_dir: Optional[Path] = None):
+        self.trace_memory = trace_memory
+        self.profile_dir = profile_dir
+        self.stats: List[PhaseStats] = []
+
+    def get_profile_path(self, day: str, phase: str) -> Optional[Path]:
+        if self.profile_dir is None:
+            return None
+
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        return self.profile_dir / f"{day}_{phase}.pstats"
+
+    def measure(self, day: str, phase: str, func: Callable, *args: Any) -> Any:
+        profile_path = self.get_profile_path(day, phase)
+        profiler = cProfile.Profile() if profile_path else None
+
+        if self.trace_memory:
+            tracemalloc.start()
+
+        blocks_before = sys.getallocatedblocks()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+
+        try:
+            result = profiler.runcall(func, *args) if profiler else func(*args)
+        finally:
+            cpu_s = time.process_time() - cpu_start
+            wall_s = time.perf_counter() - wall_start
+            net_allocated_blocks = sys.getallocatedblocks() - blocks_before
+
+            peak_bytes = None
+            if self.trace_memory:
+                peak_bytes = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+
+        if profiler and profile_path:
+            profiler.dump_stats(profile_path)
+
+        self.stats.append(
+            PhaseStats(
+                day,
+                phase,
+                wall_s,
+                cpu_s,
+                net_allocated_blocks,
+                peak_bytes,
+                str(profile_path) if profile_path else None,
+            )
+        )
+        return result
+
+    def wrap(self, solver: Solver) -> Solver:
+        def wrap_phase(phase: str, func: Callable) -> Callable:
+            return lambda *args: self.measure(solver.day, phase, func, *args)
+
+        return dataclasses.replace(
+            solver,
+            parse=wrap_phase("parse", solver.parse),
+            part1=wrap_phase("part1", solver.part1),
+            part2=wrap_phase("part2", solver.part2),
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        return {"phases": [dataclasses.asdict(stats) for stats in self.stats]}
+
+    def write_json(self, output_path: Path) -> None:
+        with open(output_path, "w") as file_handle:
+            json.dump(self.to_json(), file_handle, indent=2)
+
+    def format_table(self) -> str:
+        rows = [
+            f"{'day':<6} {'phase':<6} {'wall':>10} {'cpu':>10} {'net blocks':>10} "
+            f"{'peak':>12}"
+        ]
+
+        for stats in self.stats:
+            peak = (
+                "-" if stats.peak_bytes is None else f"{stats.peak_bytes / 1024:.1f}KB"
+            )
+            rows.append(
+                f"{stats.day:<6} {stats.phase:<6} {stats.wall_s * 1000:>8.2f}ms "
+                f"{stats.cpu_s * 1000:>8.2f}ms {stats.net_allocated_blocks:>10} "
+                f"{peak:>12}"
+            )
+
+        return "\n".join(rows)
+
+
+def run_instrumented(
+    solver: Solver,
+    parts: Sequence[int],
+    instrumenter: Instrumenter,
+    input_path: Optional[PathLike] = None,
+) -> List[Any]:
+    instrumented = instrumenter.wrap(solver)
+    parsed = instrumented.parse(iter_lines(input_path or solver.input_path))
+
+    return [instrumented.get_part(part)(parsed) for part in parts]
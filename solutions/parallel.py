@@ -0,0 +1,89 @@
+import json
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from solutions import cache
+from solutions.registry import DAYS, PARTS, get_solver
+
+DEFAULT_TIMINGS_PATH = Path(".timings.json")
+
+Job = Tuple[str, int]
+Timings = Dict[str, float]
+
+
+@dataclass
+class JobResult:
+    day: str
+    part: int
+    answer: Any
+    elapsed_s: float
+    cached: bool = False
+
+    def __str__(self):
+        source = "cached" if self.cached else f"{self.elapsed_s:.3f}s"
+        return f"{self.day} part {self.part}: {self.answer} ({source})"
+
+
+def get_job_key(job: Job) -> str:
+    day, part = job
+    return f"{day}:{part}"
+
+
+def load_timings(timings_path: Path) -> Timings:
+    if not timings_path.exists():
+        return {}
+
+    with open(timings_path) as file_handle:
+        return json.load(file_handle)
+
+
+def save_timings(timings_path: Path, results: Sequence[JobResult]) -> None:
+    timings = load_timings(timings_path)
+    # Cache hits say nothing about how long a solve takes
+    timings.update(
+        {
+            get_job_key((result.day, result.part)): result.elapsed_s
+            for result in results
+            if not result.cached
+        }
+    )
+
+    with open(timings_path, "w") as file_handle:
+        json.dump(timings, file_handle, indent=2, sort_keys=True)
+
+
+def get_schedule(jobs: Sequence[Job], timings: Timings) -> Sequence[Job]:
+    # Jobs that have never been timed might be slow, so they go out first
+    return sorted(
+        jobs, key=lambda job: timings.get(get_job_key(job), math.inf), reverse=True
+    )
+
+
+def run_job(job: Job, result_cache: Optional[cache.ResultCache]) -> JobResult:
+    day, part = job
+    start = time.perf_counter()
+    (answer,) = cache.solve(get_solver(day), (part,), result_cache=result_cache)
+    return JobResult(
+        day, part, answer.answer, time.perf_counter() - start, answer.cached
+    )
+
+
+def run_all(
+    days: Sequence[str] = DAYS,
+    workers: Optional[int] = None,
+    timings_path: Path = DEFAULT_TIMINGS_PATH,
+    result_cache: Optional[cache.ResultCache] = None,
+) -> Sequence[JobResult]:
+    jobs = [(day, part) for day in days for part in PARTS]
+    schedule = get_schedule(jobs, load_timings(timings_path))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {job: executor.submit(run_job, job, result_cache) for job in schedule}
+        results = [futures[job].result() for job in jobs]
+
+    save_timings(timings_path, results)
+    return results
@@ -0,0 +1,62 @@
+import importlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Sequence
+
+from solutions.inputs import get_input_path
+
+DAY_MODULES: Dict[str, str] = {
+    "day01": "solutions.day01.part1",
+    "day02": "solutions.day02.part1",
+    "day03": "solutions.day03.solution",
+    "day04": "solutions.day04.solution",
+    "day05": "solutions.day05.solution",
+    "day06": "solutions.day06.solution",
+    "day07": "solutions.day07.solution",
+    "day08": "solutions.day08.solution",
+    "day09": "solutions.day09.solution",
+    "day10": "solutions.day10.solution",
+    "day11": "solutions.day11.solution",
+    "day12": "solutions.day12.solution",
+    "day13": "solutions.day13.solution",
+    "day14": "solutions.day14.solution",
+    "day15": "solutions.day15.solution",
+}
+
+DAYS: Sequence[str] = tuple(DAY_MODULES)
+PARTS: Sequence[int] = (1, 2)
+
+
+@dataclass(frozen=True)
+class Solver:
+    day: str
+    parse: Callable[[Iterable[str]], Any]
+    part1: Callable[[Any], Any]
+    part2: Callable[[Any], Any]
+    input_path: Path
+    queries: Dict[str, Callable[..., Any]]
+
+    def get_part(self, part: int) -> Callable[[Any], Any]:
+        if part == 1:
+            return self.part1
+        if part == 2:
+            return self.part2
+
+        raise ValueError(f"No part {part} for {self.day}")
+
+
+def get_solver(day: str) -> Solver:
+    if day not in DAY_MODULES:
+        raise KeyError(f"Unknown day '{day}', expected one of {', '.join(DAYS)}")
+
+    # Only the requested day is imported, so its cost is the only one paid
+    module = importlib.import_module(DAY_MODULES[day])
+
+    return Solver(
+        day,
+        module.parse,  # type: ignore
+        module.part1,  # type: ignore
+        module.part2,  # type: ignore
+        get_input_path(module.__file__),  # type: ignore
+        getattr(module, "QUERIES", {}),
+    )
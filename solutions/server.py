@@ -0,0 +1,134 @@
+import json
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from solutions.inputs import iter_lines
+from solutions.registry import Solver, get_solver
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8020
+
+ParsedKey = Tuple[str, Path]
+
+
+class RequestError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class SolverState:
+    """Parsed inputs kept resident between requests, parsed once per input"""
+
+    def __init__(self):
+        self.parsed: Dict[ParsedKey, Any] = {}
+        self.locks: Dict[ParsedKey, threading.Lock] = {}
+        self.locks_lock = threading.Lock()
+
+    def get_lock(self, key: ParsedKey) -> threading.Lock:
+        with self.locks_lock:
+            return self.locks.setdefault(key, threading.Lock())
+
+    def get_parsed(self, solver: Solver, input_path: Optional[Path]) -> Any:
+        key = (solver.day, input_path or solver.input_path)
+
+        # Concurrent first requests for one input wait on a single parse
+        with self.get_lock(key):
+            if key not in self.parsed:
+                try:
+                    self.parsed[key] = solver.parse(iter_lines(key[1]))
+                except OSError as error:
+                    raise RequestError(
+                        HTTPStatus.NOT_FOUND, f"Can't read input {key[1]}: {error}"
+                    ) from error
+
+        return self.parsed[key]
+
+    def handle(self, request: Dict[str, Any]) -> Any:
+        day = request["day"]
+
+        try:
+            solver = get_solver(day)
+        except KeyError as error:
+            raise RequestError(HTTPStatus.NOT_FOUND, error.args[0]) from error
+
+        input_path = Path(request["input"]) if "input" in request else None
+
+        if "query" in request:
+            if request["query"] not in solver.queries:
+                raise RequestError(
+                    HTTPStatus.NOT_FOUND,
+                    f"No query '{request['query']}' for {solver.day}",
+                )
+            func = solver.queries[request["query"]]
+        else:
+            try:
+                func = solver.get_part(int(request.get("part", 1)))
+            except ValueError as error:
+                raise RequestError(HTTPStatus.BAD_REQUEST, str(error)) from error
+
+        parsed = self.get_parsed(solver, input_path)
+
+        try:
+            return func(parsed, **request.get("params", {}))
+        except (IndexError, KeyError, TypeError, ValueError) as error:
+            raise RequestError(HTTPStatus.BAD_REQUEST, repr(error)) from error
+
+
+class SolverServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], state: SolverState):
+        super().__init__(address, SolverRequestHandler)
+        self.state = state
+
+
+class SolverRequestHandler(BaseHTTPRequestHandler):
+    server: SolverServer
+
+    def send_json(self, status: HTTPStatus, body: Dict[str, Any]) -> None:
+        encoded = json.dumps(body).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        start = time.perf_counter()
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length))
+            result = self.server.state.handle(request)
+        except RequestError as error:
+            status, body = error.status, {"error": str(error)}
+        except (KeyError, TypeError, ValueError) as error:
+            status, body = HTTPStatus.BAD_REQUEST, {"error": repr(error)}
+        except Exception as error:  # pylint: disable=broad-except
+            # Anything else is a bug, but the client still gets a JSON answer
+            self.log_error("Unhandled error: %r", error)
+            status, body = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": repr(error)}
+        else:
+            status, body = HTTPStatus.OK, {"result": result}
+
+        body["elapsed_ms"] = (time.perf_counter() - start) * 1000
+        self.send_json(status, body)
+        self.log_message(
+            '"%s" %s %.3fms', self.requestline, status.value, body["elapsed_ms"]
+        )
+
+    def log_request(self, code="-", size="-"):
+        # Replaced by the log line in do_POST, which includes the latency
+        pass
+
+
+def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+    with SolverServer((host, port), SolverState()) as server:
+        print(f"Serving on http://{host}:{server.server_port}")
+        server.serve_forever()
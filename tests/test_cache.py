@@ -0,0 +1,22 @@
+import os
+
+from solutions.cache import ResultCache
+
+
+def test_entry_evicted_after_read(tmp_path, monkeypatch):
+    cache = ResultCache(tmp_path)
+    cache.put("key", 42)
+
+    # Another worker evicts the entry between the read and the touch
+    def evict_then_touch(path, *args, **kwargs):
+        os.remove(path)
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(os, "utime", evict_then_touch)
+    cached = cache.get("key")
+
+    assert cached and cached.answer == 42 and cached.cached
+
+
+def test_missing_entry(tmp_path):
+    assert ResultCache(tmp_path).get("key") is None
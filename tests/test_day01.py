@@ -0,0 +1,54 @@
+import tracemalloc
+
+import pytest
+
+from solutions.day01.external import find_pair, iter_numbers, partition
+from solutions.day01.ksum import KSumIndex
+
+SAMPLE = [1721, 979, 366, 299, 675, 1456]
+
+
+def test_sample_pair_and_triple():
+    index = KSumIndex(SAMPLE)
+
+    assert index.find(2020, 2) == (299, 1721)
+    assert index.find(2020, 3) == (366, 675, 979)
+
+
+@pytest.mark.parametrize("target", [-(10**12), 0, 597, 3443, 10**9, 10**12])
+def test_out_of_range_targets(target):
+    index = KSumIndex(SAMPLE)
+
+    tracemalloc.start()
+    try:
+        assert index.find(target, 2) is None
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    # The shifted bitset should never be wider than the values it holds
+    assert peak_bytes < 64 * 1024
+
+
+@pytest.mark.parametrize("stride", [1, 10, 20, 1000])
+def test_strided_values_spread_over_buckets(tmp_path, stride):
+    count, buckets = 200_000, 20
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("".join(f"{value * stride}\n" for value in range(count)))
+    bucket_dir = tmp_path / "buckets"
+    bucket_dir.mkdir()
+
+    bucket_paths = partition(input_path, 2020, buckets, bucket_dir)
+    sizes = [sum(1 for _ in iter_numbers(path)) for path in bucket_paths]
+
+    assert sum(sizes) == count
+    assert max(sizes) < 1.1 * count / buckets
+
+
+def test_external_find_pair(tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("".join(f"{value}\n" for value in SAMPLE))
+
+    pair = find_pair(input_path, 2020, memory_budget=256, workers=2)
+
+    assert pair and sorted(pair) == [299, 1721]
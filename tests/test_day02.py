@@ -0,0 +1,20 @@
+import pytest
+
+from solutions.day02.part1 import parse, part1, part2
+
+SAMPLE = ["1-3 a: abcde", "1-3 b: cdefg", "2-9 c: ccccccccc"]
+
+
+def test_sample():
+    policies = parse(SAMPLE)
+
+    assert part1(policies) == 2
+    assert part2(policies) == 1
+
+
+@pytest.mark.parametrize("line", ["x-3 b: cdefg", "1-y b: cdefg", "1-3 b cdefg"])
+def test_malformed_lines_are_skipped(line):
+    policies = parse([*SAMPLE, line])
+
+    assert part1(policies) == 2
+    assert part2(policies) == 1
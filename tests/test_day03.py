@@ -0,0 +1,35 @@
+import pytest
+
+from solutions.day03.solution import get_tree_count, get_tree_map
+
+SAMPLE = """\
+..##.......
+#...#...#..
+.#....#..#.
+..#.#...#.#
+.#...##..#.
+..#.##.....
+.#.#.#....#
+.#........#
+#.##...#...
+#...##....#
+.#..#...#.#
+"""
+
+
+@pytest.mark.parametrize(
+    "down, right, trees", [(1, 1, 2), (1, 3, 7), (1, 5, 3), (1, 7, 4), (2, 1, 2)]
+)
+def test_sample_slopes(down, right, trees):
+    assert get_tree_count(get_tree_map(SAMPLE.splitlines()), down, right) == trees
+
+
+@pytest.mark.parametrize("down", [0, -1])
+def test_slope_must_go_down(down):
+    with pytest.raises(ValueError):
+        get_tree_count(get_tree_map(SAMPLE.splitlines()), down, 3)
+
+
+def test_empty_map():
+    with pytest.raises(ValueError):
+        get_tree_count(get_tree_map([]), 1, 3)
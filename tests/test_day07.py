@@ -0,0 +1,99 @@
+import random
+from typing import Dict, List, Tuple
+
+import pytest
+
+from solutions.day07.graph import BagGraph
+from solutions.day07.solution import parse
+
+Contents = List[Tuple[int, str]]
+
+COLORS = [f"{shade} {hue}" for shade in ("dark", "light") for hue in "abcdefghij"]
+
+REPEATED_HOLDER_INPUT = """\
+light red bags contain 1 shiny gold bag.
+light red bags contain no other bags.
+shiny gold bags contain no other bags.
+"""
+
+REPEATED_RULE_INPUT = """\
+light red bags contain 1 shiny gold bag.
+dark orange bags contain 3 shiny gold bags.
+light red bags contain 1 shiny gold bag.
+"""
+
+
+def test_repeated_holder_keeps_last_rule():
+    graph = parse(REPEATED_HOLDER_INPUT.splitlines())
+
+    assert graph.count_ancestors("shiny gold") == 0
+    assert graph.get_total("light red") == 0
+
+
+def test_repeated_rule_can_be_replaced():
+    graph = parse(REPEATED_RULE_INPUT.splitlines())
+
+    assert graph.count_ancestors("shiny gold") == 2
+
+    graph.replace_rule("light red", ())
+
+    assert graph.count_ancestors("shiny gold") == 1
+
+
+def get_random_contents(rng: random.Random, holder_id: int, size: int) -> Contents:
+    # Bags only ever hold bags later in the list, so the rules never loop
+    later_ids = range(holder_id + 1, size)
+    child_ids = rng.sample(later_ids, rng.randint(0, min(3, len(later_ids))))
+    return [(rng.randint(1, 4), COLORS[child_id]) for child_id in child_ids]
+
+
+def build_graph(rules: Dict[str, Contents]) -> BagGraph:
+    tokens = []
+    for holder, contents in rules.items():
+        tokens.append((holder, "", ""))
+        tokens.extend(("", str(count), name) for count, name in contents)
+
+    return BagGraph.from_tokens(tokens)
+
+
+def check_answers(graph: BagGraph, rules: Dict[str, Contents]) -> None:
+    expected = build_graph(rules)
+
+    for name in expected.names:
+        assert graph.count_ancestors(name) == expected.count_ancestors(name)
+        assert graph.get_total(name) == expected.get_total(name)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_edits_match_rebuild(seed):
+    rng = random.Random(seed)
+    rules = {
+        color: get_random_contents(rng, color_id, len(COLORS))
+        for color_id, color in enumerate(COLORS)
+        if rng.random() < 0.7
+    }
+    graph = build_graph(rules)
+
+    for _ in range(200):
+        color_id = rng.randrange(len(COLORS))
+        color = COLORS[color_id]
+        contents = get_random_contents(rng, color_id, len(COLORS))
+
+        if color not in rules:
+            graph.add_rule(color, contents)
+            rules[color] = contents
+        elif rng.random() < 0.2:
+            graph.remove_rule(color)
+            del rules[color]
+        else:
+            graph.replace_rule(color, contents)
+            rules[color] = contents
+
+        # Querying as it goes fills in memos for the next edit to clear
+        if rng.random() < 0.3:
+            check_answers(graph, rules)
+
+        live_edges = sum(map(len, rules.values()))
+        assert len(graph.children) <= 2 * live_edges
+
+    check_answers(graph, rules)
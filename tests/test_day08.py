@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from solutions.day08 import vm
+from solutions.day08.repair import Repair, find_repairs
+from solutions.day08.solution import (
+    FLIP_OPCODES,
+    get_test_input,
+    get_toggled_run,
+    get_trace,
+    parse,
+)
+
+
+def find_repairs_by_brute_force(program: vm.Program):
+    repairs = []
+
+    for index, opcode in enumerate(program.opcodes):
+        if opcode in FLIP_OPCODES:
+            toggled_run = get_toggled_run(program, index)
+            if toggled_run.terminated:
+                repairs.append(Repair(index, toggled_run.accumulator))
+
+    return repairs
+
+
+def get_random_program(rng: random.Random, size: int) -> vm.Program:
+    lines = [
+        f"{rng.choice(vm.OPCODE_NAMES)} {rng.randint(-size, size):+d}"
+        for _ in range(size)
+    ]
+    return parse(lines)
+
+
+def test_already_terminating_program():
+    program = parse(["jmp +1", "acc +0", "nop +1", "acc -3", "nop +0"])
+
+    assert vm.run(program).terminated
+    assert find_repairs(program) == find_repairs_by_brute_force(program)
+    assert all(repair.index != 4 for repair in find_repairs(program))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_brute_force(seed):
+    rng = random.Random(seed)
+
+    for _ in range(200):
+        program = get_random_program(rng, rng.randint(1, 12))
+        assert find_repairs(program) == find_repairs_by_brute_force(program)
+
+
+def test_toggle_scan_finds_hot_loop():
+    program = parse(get_test_input())
+
+    single_run = get_trace(program)
+    scan = get_trace(program, scan_toggles=True)
+
+    assert {hot["count"] for hot in single_run["hot_instructions"]} == {1}
+    assert scan["runs"] == 1 + sum(map(FLIP_OPCODES.__contains__, program.opcodes))
+    # Every run starts through the first instructions, whichever one is toggled
+    assert scan["hot_instructions"][0]["count"] == scan["runs"]